@@ -2,7 +2,33 @@ import re
 import random
 from datetime import datetime
 
+# Default responses for unmatched patterns, built once at import
+DEFAULT_RESPONSES = (
+    "That's interesting! Tell me more.",
+    "I see. What else would you like to know?",
+    "Thanks for sharing! Is there anything specific you'd like to talk about?",
+    "I'm still learning. Could you rephrase that?",
+    "That's cool! What's on your mind?"
+)
+
+# Intent patterns, one (label, regex) pair per intent, checked in order
+INTENT_PATTERNS = [
+    ('greeting', r'\b(?:hi|hello|hey|greetings|good morning|good afternoon)\b'),
+    ('farewell', r'\b(?:bye|goodbye|see you|farewell|quit|exit)\b'),
+    ('thanks', r'\b(?:thanks|thank you|appreciate it)\b'),
+    ('name', r'\b(?:what.*your name|who are you|your name)\b'),
+    ('weather', r'\b(?:weather|rain|sunny|temperature|forecast)\b'),
+    ('joke', r'\b(?:joke|funny|make me laugh)\b'),
+    ('help', r'\b(?:help|what can you do|how does this work)\b'),
+]
+
 class SimpleChatbot:
+    # All intents fused into one alternation so a message is scanned once
+    # instead of once per intent; the matched named group is the label
+    _INTENT_RE = re.compile(
+        '|'.join(f'(?P<{name}>{pattern})' for name, pattern in INTENT_PATTERNS)
+    )
+
     def __init__(self):
         self.name = "ChatBot"
         self.responses = {
@@ -45,63 +71,23 @@ class SimpleChatbot:
     
     def find_pattern(self, message):
         """Match user input to response patterns"""
-        message_lower = message.lower()
-        
-        # Greeting patterns
-        if re.search(r'\b(hi|hello|hey|greetings|good morning|good afternoon)\b', message_lower):
-            return 'greeting'
-        
-        # Farewell patterns
-        elif re.search(r'\b(bye|goodbye|see you|farewell|quit|exit)\b', message_lower):
-            return 'farewell'
-        
-        # Thanks patterns
-        elif re.search(r'\b(thanks|thank you|appreciate it)\b', message_lower):
-            return 'thanks'
-        
-        # Name patterns
-        elif re.search(r'\b(what.*your name|who are you|your name)\b', message_lower):
-            return 'name'
-        
-        # Weather patterns
-        elif re.search(r'\b(weather|rain|sunny|temperature|forecast)\b', message_lower):
-            return 'weather'
-        
-        # Joke patterns
-        elif re.search(r'\b(joke|funny|make me laugh)\b', message_lower):
-            return 'joke'
-        
-        # Help patterns
-        elif re.search(r'\b(help|what can you do|how does this work)\b', message_lower):
-            return 'help'
-        
-        # Default response
-        else:
-            return 'default'
-    
-    def get_response(self, message):
+        match = self._INTENT_RE.search(message.lower())
+        return match.lastgroup if match else 'default'
+
+    def get_response(self, message, pattern=None):
         """Generate response based on pattern"""
-        pattern = self.find_pattern(message)
-        
-        if pattern in self.responses:
-            return random.choice(self.responses[pattern])
-        else:
-            # Default responses for unmatched patterns
-            default_responses = [
-                "That's interesting! Tell me more.",
-                "I see. What else would you like to know?",
-                "Thanks for sharing! Is there anything specific you'd like to talk about?",
-                "I'm still learning. Could you rephrase that?",
-                "That's cool! What's on your mind?"
-            ]
-            return random.choice(default_responses)
+        if pattern is None:
+            pattern = self.find_pattern(message)
+
+        return random.choice(self.responses.get(pattern, DEFAULT_RESPONSES))
     
     def chat(self, message):
         """Main chat method"""
-        response = self.get_response(message)
+        pattern = self.find_pattern(message)
+        response = self.get_response(message, pattern)
         return {
             "user_message": message,
             "bot_response": response,
             "timestamp": datetime.now().isoformat(),
-            "pattern": self.find_pattern(message)
+            "pattern": pattern
         }
\ No newline at end of file
@@ -1,5 +1,5 @@
-from asyncio import wait
-from time import sleep
+import asyncio
+from collections import deque
 from fastapi import FastAPI, Request
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
@@ -34,8 +34,9 @@ class ChatResponse(BaseModel):
 class ChatHistory(BaseModel):
     conversations: List[Dict[str, Any]]
 
-# Store chat history (in production, use database)
-chat_history = []
+# Store chat history (in production, use database); deque evicts the
+# oldest entry in O(1) once 50 messages are stored
+chat_history = deque(maxlen=50)
 
 @app.get("/", response_class=HTMLResponse)
 async def read_root(request: Request):
@@ -61,15 +62,12 @@ async def chat_endpoint(request: ChatRequest):
         # Get bot response
         response = chatbot.chat(request.message)
         
-        # Store in history (simple in-memory storage)
+        # Store in history (simple in-memory storage, last 50 messages)
         chat_history.append(response)
-        
-        # Keep only last 50 messages
-        if len(chat_history) > 50:
-            chat_history.pop(0)
 
-        # wait for 2 seconds before returning the response
-        sleep(2)
+        # wait for 2 seconds before returning the response without
+        # blocking the event loop for other requests
+        await asyncio.sleep(2)
         
         return ChatResponse(**response)
         
@@ -84,13 +82,12 @@ async def chat_endpoint(request: ChatRequest):
 @app.get("/history", response_model=ChatHistory)
 async def get_chat_history():
     """Get chat history"""
-    return {"conversations": chat_history}
+    return {"conversations": list(chat_history)}
 
 @app.delete("/history")
 async def clear_chat_history():
     """Clear chat history"""
-    global chat_history
-    chat_history = []
+    chat_history.clear()
     return {"message": "Chat history cleared"}
 
 @app.get("/patterns")
@@ -59,9 +59,11 @@ def deep_crawl():
         report = ReportGenerator.generate_report(crawl_results)
         report_dict = report.to_dict()
         
-        # Save report
+        # Append report to the shared log (one file, no per-crawl inode);
+        # passing the dataclass lets orjson serialize it without a second
+        # to_dict() walk of the page tree
         domain = crawl_results['base_domain']
-        saved_path = FileUtils.save_report(report_dict, domain)
+        saved_path = FileUtils.append_report(report, domain)
         
         logging.info(f"✅ Crawling completed: {crawl_results['total_pages_crawled']} pages crawled")
         
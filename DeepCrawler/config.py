@@ -11,6 +11,11 @@ class Config:
     MAX_TOTAL_PAGES = 50
     PAGE_LOAD_TIMEOUT = 10
     CRAWL_DELAY = 1
+    MAX_CONCURRENCY = 8
+
+    # Report settings: pretty reports are indented and uncompressed for
+    # human inspection; production keeps the compact fast path
+    PRETTY_REPORTS = False
     
     # Browser settings
     BROWSER_HEADLESS = True
@@ -21,6 +26,7 @@ class Config:
     BASE_DIR = os.path.dirname(os.path.abspath(__file__))
     OUTPUT_DIR = os.path.join(BASE_DIR, "outputs")
     REPORTS_DIR = os.path.join(OUTPUT_DIR, "reports")
+    REPORTS_LOG = os.path.join(REPORTS_DIR, "reports.jsonl")
     EXPORTS_DIR = os.path.join(OUTPUT_DIR, "exports")
     LOGS_DIR = os.path.join(BASE_DIR, "logs")
     
@@ -1,32 +1,78 @@
 # src/crawler/data_extractor.py
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
+from collections import defaultdict
 from urllib.parse import urljoin, urlparse
 from typing import List, Dict, Any
 from ..models.data_models import *
 
 class DataExtractor:
     """Handles data extraction from web pages"""
-    
+
+    # Tags collected during the single DOM pass, mapped to the bucket each
+    # extractor consumes (related tags share a bucket in document order)
+    _TAG_BUCKETS = {
+        'p': 'paragraphs',
+        'ul': 'lists', 'ol': 'lists',
+        'b': 'bold', 'strong': 'bold',
+        'i': 'italic', 'em': 'italic',
+        'code': 'code', 'pre': 'code',
+        'blockquote': 'quotes',
+        'a': 'links',
+        'img': 'images',
+        'table': 'tables',
+        'form': 'forms',
+        'meta': 'meta',
+        'h1': 'headings', 'h2': 'headings', 'h3': 'headings',
+        'h4': 'headings', 'h5': 'headings', 'h6': 'headings',
+    }
+
+    # Tags whose subtrees are dropped before extraction
+    _STRIP_TAGS = frozenset({'script', 'style', 'nav', 'footer', 'header'})
+
     @staticmethod
-    def extract_comprehensive_data(url: str, soup: BeautifulSoup) -> PageData:
-        """Extract comprehensive data from page"""
+    def extract_comprehensive_data(url: str, page_source: str) -> PageData:
+        """Extract comprehensive data from raw page HTML"""
+        # Taking the raw HTML (not a pre-built soup) keeps the arguments
+        # picklable so extraction can run in a worker process
+        soup = BeautifulSoup(page_source, 'lxml')
+
         # Basic info
         title = soup.find('title')
         title_text = title.get_text().strip() if title else "No Title"
-        
-        # Remove unwanted elements
-        for element in soup(["script", "style", "nav", "footer", "header"]):
-            element.decompose()
-        
-        # Extract various data types
-        text_content = DataExtractor.extract_text_content(soup)
-        links = DataExtractor.extract_links(soup, url)
-        images = DataExtractor.extract_images(soup, url)
-        tables = DataExtractor.extract_tables(soup)
-        forms = DataExtractor.extract_forms(soup)
-        headings = DataExtractor.extract_headings(soup)
-        metadata = DataExtractor.extract_metadata(soup)
-        
+
+        # Single fused pass over the DOM: unwanted subtrees are skipped and
+        # detached in the same walk that buckets every tag of interest, so
+        # cleanup no longer needs its own traversal
+        buckets = defaultdict(list)
+        tag_buckets = DataExtractor._TAG_BUCKETS
+        strip_tags = DataExtractor._STRIP_TAGS
+        node = soup.contents[0] if soup.contents else None
+        while node is not None:
+            name = node.name
+            if name in strip_tags:
+                # Step over the subtree before detaching it
+                nxt = node.next_sibling
+                parent = node.parent
+                while nxt is None and parent is not None:
+                    nxt = parent.next_sibling
+                    parent = parent.parent
+                node.decompose()
+                node = nxt
+                continue
+            bucket = tag_buckets.get(name)
+            if bucket is not None:
+                buckets[bucket].append(node)
+            node = node.next_element
+
+        # Extract various data types from the buckets
+        text_content = DataExtractor.extract_text_content(buckets)
+        links = DataExtractor.extract_links(buckets['links'], url)
+        images = DataExtractor.extract_images(buckets['images'], url)
+        tables = DataExtractor.extract_tables(buckets['tables'])
+        forms = DataExtractor.extract_forms(buckets['forms'])
+        headings = DataExtractor.extract_headings(buckets)
+        metadata = DataExtractor.extract_metadata(buckets['meta'])
+
         return PageData(
             url=url,
             title=title_text,
@@ -43,9 +89,9 @@ class DataExtractor:
             forms_found=len(forms),
             timestamp=time.time()
         )
-    
+
     @staticmethod
-    def extract_text_content(soup: BeautifulSoup) -> TextContent:
+    def extract_text_content(buckets: Dict[str, List[Tag]]) -> TextContent:
         """Extract and categorize text content"""
         paragraphs = []
         lists_data = []
@@ -53,50 +99,49 @@ class DataExtractor:
         italic_text = []
         code_blocks = []
         quotes = []
-        
-        # Paragraphs
-        for p in soup.find_all('p'):
+
+        # Paragraphs; counting words per paragraph as we go avoids joining
+        # every paragraph into one giant string just to split it again
+        total_word_count = 0
+        for p in buckets['paragraphs']:
             text = p.get_text().strip()
             if text and len(text) > 10:
                 paragraphs.append(text)
-        
+                total_word_count += len(text.split())
+
         # Lists
-        for lst in soup.find_all(['ul', 'ol']):
+        for lst in buckets['lists']:
             items = [li.get_text().strip() for li in lst.find_all('li')]
             if items:
                 lists_data.append({
                     'type': lst.name,
                     'items': items
                 })
-        
+
         # Bold text
-        for elem in soup.find_all(['b', 'strong']):
+        for elem in buckets['bold']:
             text = elem.get_text().strip()
             if text:
                 bold_text.append(text)
-        
+
         # Italic text
-        for elem in soup.find_all(['i', 'em']):
+        for elem in buckets['italic']:
             text = elem.get_text().strip()
             if text:
                 italic_text.append(text)
-        
+
         # Code blocks
-        for elem in soup.find_all(['code', 'pre']):
+        for elem in buckets['code']:
             text = elem.get_text().strip()
             if text:
                 code_blocks.append(text)
-        
+
         # Quotes
-        for quote in soup.find_all('blockquote'):
+        for quote in buckets['quotes']:
             text = quote.get_text().strip()
             if text:
                 quotes.append(text)
-        
-        # Total word count
-        all_text = ' '.join(paragraphs)
-        total_word_count = len(all_text.split())
-        
+
         return TextContent(
             paragraphs=paragraphs,
             lists=lists_data,
@@ -106,23 +151,38 @@ class DataExtractor:
             quotes=quotes,
             total_word_count=total_word_count
         )
-    
+
     @staticmethod
-    def extract_links(soup: BeautifulSoup, base_url: str) -> List[LinkData]:
+    def extract_links(anchors: List[Tag], base_url: str) -> List[LinkData]:
         """Extract all links with context"""
         links = []
         base_domain = urlparse(base_url).netloc
-        
-        for a in soup.find_all('a', href=True):
+
+        # Same-origin test by string prefix: urlparse per link is far more
+        # expensive than a startswith over these precomputed prefixes
+        http_origin = 'http://' + base_domain
+        https_origin = 'https://' + base_domain
+        same_origin_prefixes = tuple(
+            origin + sep
+            for origin in (http_origin, https_origin)
+            for sep in ('/', ':', '?', '#')
+        )
+
+        for a in anchors:
             try:
+                if not a.has_attr('href'):
+                    continue
+
                 text = a.get_text().strip()
                 href = str(a['href'])
-                
+
                 if href and not href.startswith(('javascript:', 'mailto:', 'tel:')):
                     full_url = urljoin(base_url, href)
-                    
+
                     if full_url.startswith('http'):
-                        is_external = urlparse(full_url).netloc != base_domain 
+                        is_external = not (full_url.startswith(same_origin_prefixes)
+                                           or full_url == http_origin
+                                           or full_url == https_origin)
                         link_data = LinkData(
                             text=text[:200],
                             url=full_url,
@@ -134,20 +194,23 @@ class DataExtractor:
                         links.append(link_data)
             except Exception:
                 continue
-        
+
         return links
-    
+
     @staticmethod
-    def extract_images(soup: BeautifulSoup, base_url: str) -> List[ImageData]:
+    def extract_images(imgs: List[Tag], base_url: str) -> List[ImageData]:
         """Extract all images with details"""
         images = []
-        
-        for img in soup.find_all('img', src=True):
+
+        for img in imgs:
             try:
+                if not img.has_attr('src'):
+                    continue
+
                 src = str(img.get('src'))
                 if src:
                     full_src = urljoin(base_url, src)
-                    
+
                     image_data = ImageData(
                         src=full_src,
                         alt=str(img.get('alt', 'No alt text')),
@@ -160,32 +223,32 @@ class DataExtractor:
                     images.append(image_data)
             except Exception:
                 continue
-        
+
         return images
-    
+
     @staticmethod
-    def extract_tables(soup: BeautifulSoup) -> List[TableData]:
+    def extract_tables(table_tags: List[Tag]) -> List[TableData]:
         """Extract table data"""
         tables = []
-        
-        for table in soup.find_all('table'):
+
+        for table in table_tags:
             try:
                 headers = []
                 rows = []
                 caption = table.find('caption')
                 caption_text = caption.get_text().strip() if caption else ''
-                
+
                 # Extract headers
                 for header in table.find_all('th'):
                     headers.append(header.get_text().strip())
-                
+
                 # Extract rows
                 for row in table.find_all('tr'):
                     cells = row.find_all(['td', 'th'])
                     row_data = [cell.get_text().strip() for cell in cells]
                     if row_data:
                         rows.append(row_data)
-                
+
                 table_data = TableData(
                     headers=headers,
                     rows=rows,
@@ -194,18 +257,18 @@ class DataExtractor:
                 tables.append(table_data)
             except Exception:
                 continue
-        
+
         return tables
-    
+
     @staticmethod
-    def extract_forms(soup: BeautifulSoup) -> List[FormData]:
+    def extract_forms(form_tags: List[Tag]) -> List[FormData]:
         """Extract form data"""
         forms = []
-        
-        for form in soup.find_all('form'):
+
+        for form in form_tags:
             try:
                 inputs_data = []
-                
+
                 # Extract form inputs
                 for inp in form.find_all(['input', 'textarea', 'select']):
                     input_data = {
@@ -216,7 +279,7 @@ class DataExtractor:
                         'required': inp.get('required') is not None
                     }
                     inputs_data.append(input_data)
-                
+
                 form_data = FormData(
                     action=str(form.get('action', '')),
                     method=str(form.get('method', 'get')),
@@ -225,25 +288,26 @@ class DataExtractor:
                 forms.append(form_data)
             except Exception:
                 continue
-        
+
         return forms
-    
+
     @staticmethod
-    def extract_headings(soup: BeautifulSoup) -> Dict[str, List[str]]:
+    def extract_headings(buckets: Dict[str, List[Tag]]) -> Dict[str, List[str]]:
         """Extract heading structure"""
-        headings = {}
-        for i in range(1, 7):
-            h_tags = soup.find_all(f'h{i}')
-            headings[f'h{i}'] = [h.get_text().strip() for h in h_tags if h.get_text().strip()]
+        headings = {f'h{i}': [] for i in range(1, 7)}
+        for h in buckets['headings']:
+            text = h.get_text().strip()
+            if text:
+                headings[h.name].append(text)
         return headings
-    
+
     @staticmethod
-    def extract_metadata(soup: BeautifulSoup) -> Dict[str, str]:
+    def extract_metadata(meta_tags: List[Tag]) -> Dict[str, str]:
         """Extract meta tags"""
         metadata = {}
-        for meta in soup.find_all('meta'):
+        for meta in meta_tags:
             name = meta.get('name') or meta.get('property')
             content = meta.get('content', '')
             if name and content:
                 metadata[name] = content
-        return metadata
\ No newline at end of file
+        return metadata
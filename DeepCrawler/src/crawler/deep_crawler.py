@@ -1,23 +1,35 @@
 # src/crawler/deep_crawler.py
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.chrome.options import Options
-from bs4 import BeautifulSoup
+from selenium.webdriver.support.ui import WebDriverWait
+import aiohttp
+import asyncio
+import os
 import time
-import hashlib
+import zlib
 from urllib.parse import urlparse
 from collections import deque
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, Any, Optional
 
 from ..models.data_models import *
 from .data_extractor import DataExtractor
 from config import Config
 
+# File extensions that are never worth crawling
+_SKIP_EXTENSIONS = frozenset({'.pdf', '.jpg', '.png', '.gif', '.zip', '.exe'})
+
 class DeepWebCrawler:
     """Main crawler class for deep web crawling"""
     
-    def __init__(self, max_depth: int = Config.MAX_DEPTH, max_pages_per_level: int = Config.MAX_PAGES_PER_LEVEL):
+    def __init__(self, max_depth: int = Config.MAX_DEPTH, max_pages_per_level: int = Config.MAX_PAGES_PER_LEVEL,
+                 use_browser: bool = False, max_concurrency: int = Config.MAX_CONCURRENCY):
         self.max_depth = max_depth
         self.max_pages_per_level = max_pages_per_level
+        self.use_browser = use_browser
+        self.max_concurrency = max_concurrency
         self.visited_urls = set()
         self.crawl_data = {}
         self.driver = None
@@ -33,13 +45,27 @@ class DeepWebCrawler:
             chrome_options.add_argument("--disable-gpu")
             chrome_options.add_argument(f"--window-size={Config.BROWSER_WINDOW_SIZE}")
             chrome_options.add_argument(f"--user-agent={Config.USER_AGENT}")
-            
+            # Return from driver.get on DOMContentLoaded instead of full load
+            chrome_options.page_load_strategy = 'eager'
+            # Images are extracted from the HTML; downloading them is wasted
+            # bandwidth and render time
+            chrome_options.add_experimental_option(
+                "prefs", {"profile.managed_default_content_settings.images": 2}
+            )
+
             self.driver = webdriver.Chrome(options=chrome_options)
             return True
         except Exception as e:
             print(f"❌ ChromeDriver error: {e}")
             return False
     
+    @staticmethod
+    def _page_key(url: str) -> str:
+        """Short unique key for a crawled page (non-cryptographic)"""
+        # crc32 is ~20x faster than the md5 digest this used to be; the key
+        # only needs to be unique enough to index crawl_data
+        return format(zlib.crc32(url.encode()), '08x')
+
     def get_domain(self, url: str) -> str:
         """Extract domain from URL"""
         return urlparse(url).netloc
@@ -55,13 +81,16 @@ class DeepWebCrawler:
         
         if not url.startswith(('http://', 'https://')):
             return False
-            
-        # Skip non-web resources
-        if any(ext in url.lower() for ext in ['.pdf', '.jpg', '.png', '.gif', '.zip', '.exe']):
+
+        # Parse once; the same result serves the extension and domain checks
+        parsed = urlparse(url)
+
+        # Skip non-web resources via a single O(1) set probe
+        if os.path.splitext(parsed.path)[1].lower() in _SKIP_EXTENSIONS:
             return False
-            
+
         # Only crawl same domain
-        return self.get_domain(url) == base_domain
+        return parsed.netloc == base_domain
     
     def crawl_page(self, url: str, depth: int) -> Optional[PageData]:
         """Crawl a single page"""
@@ -72,34 +101,132 @@ class DeepWebCrawler:
         self.visited_urls.add(url)
         
         try:
-            if self.driver is None:
-                self.setup_driver()
+            # Politeness delay, once per page request; deep_crawl guarantees
+            # the driver exists before the BFS starts
+            time.sleep(Config.CRAWL_DELAY)
+
+            self.driver.get(url)
+            # Proceed as soon as the page is actually ready instead of
+            # sleeping for the full timeout on every page
+            try:
+                WebDriverWait(self.driver, Config.PAGE_LOAD_TIMEOUT).until(
+                    lambda driver: driver.execute_script('return document.readyState') == 'complete'
+                )
+            except TimeoutException:
+                # A hanging subresource can keep readyState from ever
+                # reaching complete; extract whatever has rendered
+                # rather than dropping the page
+                print(f"⏳ Load timeout on {url}, extracting partial page")
+
+            # Extract comprehensive data from the rendered page source
+            page_data = DataExtractor.extract_comprehensive_data(url, self.driver.page_source)
+
+            if page_data:
+                # Generate unique key for this page
+                self.crawl_data[self._page_key(url)] = page_data
+
+                return page_data
             else:
-                self.driver.get(url)
-                time.sleep(Config.PAGE_LOAD_TIMEOUT)
-                
-                # Get page source and parse with BeautifulSoup
-                page_source = self.driver.page_source
-                soup = BeautifulSoup(page_source, 'html.parser')
-                
-                # Extract comprehensive data
-                page_data = DataExtractor.extract_comprehensive_data(url, soup)
-                
-                if page_data:
-                    # Generate unique key for this page
-                    page_key = hashlib.md5(url.encode()).hexdigest()[:10]
-                    self.crawl_data[page_key] = page_data
-                    
-                    return page_data
-                else:
-                    return None
-                    
+                return None
+
         except Exception as e:
             print(f"❌ Failed to crawl {url}: {e}")
             return None
     
+    async def _fetch(self, session: "aiohttp.ClientSession", url: str,
+                     semaphore: "asyncio.Semaphore") -> tuple:
+        """Fetch a single page, bounded by the concurrency semaphore"""
+        async with semaphore:
+            try:
+                async with session.get(url) as response:
+                    if 'text/html' not in response.headers.get('Content-Type', 'text/html'):
+                        return url, None
+                    return url, await response.text()
+            except Exception as e:
+                print(f"❌ Failed to fetch {url}: {e}")
+                return url, None
+
+    async def _deep_crawl_async(self, start_url: str) -> Dict[str, Any]:
+        """Crawl breadth-first in concurrent waves using aiohttp"""
+        base_domain = self.get_domain(start_url)
+        crawl_start_time = time.time()
+
+        frontier = [start_url]
+        depth = 0
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        timeout = aiohttp.ClientTimeout(total=Config.PAGE_LOAD_TIMEOUT)
+
+        loop = asyncio.get_running_loop()
+
+        pool = ProcessPoolExecutor()
+        try:
+            async with aiohttp.ClientSession(headers={'User-Agent': Config.USER_AGENT},
+                                             timeout=timeout) as session:
+                while frontier and depth <= self.max_depth and len(self.crawl_data) < Config.MAX_TOTAL_PAGES:
+                    print(f"🔍 Crawling (Level {depth}): {len(frontier)} pages")
+                    self.visited_urls.update(frontier)
+
+                    # Fetch the whole depth level concurrently
+                    fetched = await asyncio.gather(
+                        *[self._fetch(session, url, semaphore) for url in frontier]
+                    )
+                    downloaded = [(url, page_source) for url, page_source in fetched
+                                  if page_source is not None]
+
+                    # Parsing is CPU-bound: run it across worker processes so
+                    # it doesn't block the event loop
+                    pages = await asyncio.gather(
+                        *[loop.run_in_executor(pool, DataExtractor.extract_comprehensive_data, url, page_source)
+                          for url, page_source in downloaded]
+                    )
+
+                    next_frontier = []
+                    queued = set()
+                    for (url, _), page_data in zip(downloaded, pages):
+                        if not page_data:
+                            continue
+
+                        self.crawl_data[self._page_key(url)] = page_data
+
+                        if len(self.crawl_data) >= Config.MAX_TOTAL_PAGES:
+                            break
+
+                        if depth < self.max_depth:
+                            # Limit links per page; islice stops scanning the
+                            # link list as soon as the quota is filled
+                            internal_links = islice(
+                                (link for link in page_data.links
+                                 if not link.is_external and link.url not in queued
+                                 and self.should_crawl(link.url, base_domain)),
+                                self.max_pages_per_level)
+                            for link in internal_links:
+                                queued.add(link.url)
+                                next_frontier.append(link.url)
+
+                    frontier = next_frontier
+                    depth += 1
+        finally:
+            pool.shutdown()
+
+        return {
+            'start_url': start_url,
+            'base_domain': base_domain,
+            'crawl_data': self.crawl_data,
+            'crawl_start_time': crawl_start_time,
+            'crawl_end_time': time.time(),
+            'total_pages_crawled': len(self.crawl_data)
+        }
+
     def deep_crawl(self, start_url: str) -> Dict[str, Any]:
         """Perform deep crawling starting from URL"""
+        if not self.use_browser:
+            # Fast path: concurrent HTTP fetches, no browser needed
+            try:
+                return asyncio.run(self._deep_crawl_async(start_url))
+            except Exception as e:
+                return {'error': f'Crawling failed: {str(e)}'}
+
+        # Browser fallback for JS-heavy sites
         if not self.setup_driver():
             return {'error': 'Failed to initialize browser'}
         
@@ -118,14 +245,14 @@ class DeepWebCrawler:
                 if page_data:
                     # If not at max depth, add links to queue
                     if depth < self.max_depth:
-                        internal_links = [link for link in page_data.links 
-                                        if not link.is_external and self.should_crawl(link.url, base_domain)]
-                        
-                        # Limit links per page to avoid too many requests
-                        for link in internal_links[:self.max_pages_per_level]:
-                            if link.url not in self.visited_urls:
-                                queue.append((link.url, depth + 1))
-                                time.sleep(Config.CRAWL_DELAY)
+                        # Limit links per page; islice stops scanning the
+                        # link list as soon as the quota is filled
+                        internal_links = islice(
+                            (link for link in page_data.links
+                             if not link.is_external and self.should_crawl(link.url, base_domain)),
+                            self.max_pages_per_level)
+                        for link in internal_links:
+                            queue.append((link.url, depth + 1))
                 
                 # Stop if we've crawled enough pages
                 if len(self.crawl_data) >= Config.MAX_TOTAL_PAGES:
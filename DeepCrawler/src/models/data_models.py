@@ -3,7 +3,7 @@ from dataclasses import dataclass, asdict
 from typing import List, Dict, Any
 import time
 
-@dataclass
+@dataclass(slots=True)
 class LinkData:
     """Data model for extracted links"""
     text: str
@@ -16,7 +16,7 @@ class LinkData:
     def to_dict(self):
         return asdict(self)
 
-@dataclass
+@dataclass(slots=True)
 class ImageData:
     """Data model for extracted images"""
     src: str
@@ -30,7 +30,7 @@ class ImageData:
     def to_dict(self):
         return asdict(self)
 
-@dataclass
+@dataclass(slots=True)
 class TableData:
     """Data model for extracted tables"""
     headers: List[str]
@@ -40,7 +40,7 @@ class TableData:
     def to_dict(self):
         return asdict(self)
 
-@dataclass
+@dataclass(slots=True)
 class FormData:
     """Data model for extracted forms"""
     action: str
@@ -50,7 +50,7 @@ class FormData:
     def to_dict(self):
         return asdict(self)
 
-@dataclass
+@dataclass(slots=True)
 class TextContent:
     """Data model for text content"""
     paragraphs: List[str]
@@ -64,7 +64,7 @@ class TextContent:
     def to_dict(self):
         return asdict(self)
 
-@dataclass
+@dataclass(slots=True)
 class PageData:
     """Data model for complete page data"""
     url: str
@@ -83,16 +83,27 @@ class PageData:
     timestamp: float
     
     def to_dict(self):
-        data = asdict(self)
-        # Convert nested objects
-        data['text_content'] = self.text_content.to_dict()
-        data['links'] = [link.to_dict() for link in self.links]
-        data['images'] = [image.to_dict() for image in self.images]
-        data['tables'] = [table.to_dict() for table in self.tables]
-        data['forms'] = [form.to_dict() for form in self.forms]
-        return data
+        # Built by hand rather than asdict(): asdict walks every nested
+        # dataclass reflectively and would redo the work of the nested
+        # to_dict calls a second time
+        return {
+            'url': self.url,
+            'title': self.title,
+            'text_content': self.text_content.to_dict(),
+            'links': [link.to_dict() for link in self.links],
+            'images': [image.to_dict() for image in self.images],
+            'tables': [table.to_dict() for table in self.tables],
+            'forms': [form.to_dict() for form in self.forms],
+            'headings_structure': self.headings_structure,
+            'metadata': self.metadata,
+            'links_found': self.links_found,
+            'images_found': self.images_found,
+            'tables_found': self.tables_found,
+            'forms_found': self.forms_found,
+            'timestamp': self.timestamp
+        }
 
-@dataclass
+@dataclass(slots=True)
 class CrawlSummary:
     """Data model for crawl summary"""
     start_url: str
@@ -110,7 +121,7 @@ class CrawlSummary:
     def to_dict(self):
         return asdict(self)
 
-@dataclass
+@dataclass(slots=True)
 class CrawlReport:
     """Data model for complete crawl report"""
     crawl_summary: CrawlSummary
@@ -120,7 +131,10 @@ class CrawlReport:
     detailed_pages: Dict[str, PageData]
     
     def to_dict(self):
-        data = asdict(self)
-        data['crawl_summary'] = self.crawl_summary.to_dict()
-        data['detailed_pages'] = {k: v.to_dict() for k, v in self.detailed_pages.items()}
-        return data
\ No newline at end of file
+        return {
+            'crawl_summary': self.crawl_summary.to_dict(),
+            'pages_by_depth': self.pages_by_depth,
+            'site_structure': self.site_structure,
+            'content_analysis': self.content_analysis,
+            'detailed_pages': {k: v.to_dict() for k, v in self.detailed_pages.items()}
+        }
\ No newline at end of file
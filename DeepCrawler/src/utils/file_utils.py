@@ -1,49 +1,178 @@
 # src/utils/file_utils.py
-import json
+import orjson
 import os
+import time
+import zstandard as zstd
 from typing import Dict, Any, List
 from config import Config
 
 class FileUtils:
     """Handles file operations for the crawler"""
-    
+
+    # Shared append-only handle for the reports log, opened on first use
+    _reports_log = None
+
+    # Indented output for humans, dataclasses serialized natively
+    _DUMP_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_DATACLASS
+
+    @classmethod
+    def append_report(cls, report: Any, domain: str) -> str:
+        """Append a crawl report to the shared JSONL reports log
+
+        Accepts either a plain dict or the CrawlReport dataclass; the
+        dataclass path lets orjson walk the report tree natively in C
+        without a to_dict() conversion materializing it first.
+        """
+        if cls._reports_log is None:
+            cls._reports_log = open(Config.REPORTS_LOG, 'ab')
+
+        record = orjson.dumps({'domain': domain, 'report': report},
+                              option=orjson.OPT_SERIALIZE_DATACLASS)
+        cls._reports_log.write(record + b'\n')
+        cls._reports_log.flush()
+
+        return Config.REPORTS_LOG
+
     @staticmethod
-    def save_report(report: Dict[str, Any], domain: str) -> str:
-        """Save crawl report to file"""
+    def _write_atomic(filepath: str, payload: bytes) -> None:
+        """Write payload atomically: tmp file, one write, fsync, rename"""
+        tmp = f"{filepath}.tmp.{os.getpid()}"
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, payload)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.rename(tmp, filepath)
+
+    @staticmethod
+    def _pages_path(filepath: str) -> str:
+        """Sidecar JSONL path holding a report's detailed pages"""
+        if filepath.endswith('.json.zst'):
+            return filepath[:-len('.json.zst')] + '.pages.jsonl.zst'
+        return os.path.splitext(filepath)[0] + '.pages.jsonl'
+
+    @staticmethod
+    def save_report(report: Dict[str, Any], domain: str,
+                    pretty: bool = Config.PRETTY_REPORTS) -> str:
+        """Save crawl report to file
+
+        By default (Config.PRETTY_REPORTS) the on-disk copy is compact
+        orjson compressed with zstd; pretty reports are indented and
+        uncompressed, meant for human inspection.
+        """
         filename = Config.get_report_filename(domain)
         filepath = os.path.join(Config.REPORTS_DIR, filename)
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
-        
+
+        # The summary sections stay in the main file; detailed_pages (the
+        # bulk of the report) streams to a sidecar JSONL one page at a
+        # time, so the encoder buffer holds a single page, not the crawl
+        header = {k: v for k, v in report.items() if k != 'detailed_pages'}
+
+        if pretty:
+            FileUtils._write_atomic(
+                filepath, orjson.dumps(header, option=FileUtils._DUMP_OPTIONS))
+            FileUtils._stream_pages(FileUtils._pages_path(filepath), report, None)
+            return filepath
+
+        # Crawl reports are highly repetitive (URLs, HTML tokens) and
+        # typically shrink 5-10x at zstd level 3, which compresses faster
+        # than the saved disk bandwidth costs
+        filepath += '.zst'
+        compressor = zstd.ZstdCompressor(level=3, threads=-1)
+
+        FileUtils._write_atomic(filepath, compressor.compress(orjson.dumps(header)))
+        FileUtils._stream_pages(FileUtils._pages_path(filepath), report, compressor)
+
         return filepath
+
+    @staticmethod
+    def _stream_pages(pages_path: str, report: Dict[str, Any], compressor) -> None:
+        """Stream detailed pages to the sidecar, atomically via tmp+rename"""
+        tmp = f"{pages_path}.tmp.{os.getpid()}"
+        with open(tmp, 'wb') as f:
+            if compressor is not None:
+                with compressor.stream_writer(f, closefd=False) as writer:
+                    FileUtils._write_page_records(writer, report)
+            else:
+                FileUtils._write_page_records(f, report)
+            f.flush()
+            os.fsync(f.fileno())
+        os.rename(tmp, pages_path)
+
+    @staticmethod
+    def _write_page_records(writer, report: Dict[str, Any]) -> None:
+        for key, page in report.get('detailed_pages', {}).items():
+            writer.write(orjson.dumps({'key': key, 'page': page}))
+            writer.write(b'\n')
     
     @staticmethod
     def save_export(data: Dict[str, Any], domain: str) -> str:
         """Save data export to file"""
         filename = Config.get_export_filename(domain)
         filepath = os.path.join(Config.EXPORTS_DIR, filename)
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        
+
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(data, option=FileUtils._DUMP_OPTIONS))
+
         return filepath
     
+    @staticmethod
+    def _read_bytes(filepath: str) -> bytes:
+        """Read a report file, decompressing zstd payloads transparently"""
+        with open(filepath, 'rb') as f:
+            if filepath.endswith('.zst'):
+                return zstd.ZstdDecompressor().stream_reader(f).read()
+            return f.read()
+
     @staticmethod
     def load_report(filename: str) -> Dict[str, Any]:
         """Load crawl report from file"""
         filepath = os.path.join(Config.REPORTS_DIR, filename)
-        
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
+
+        report = orjson.loads(FileUtils._read_bytes(filepath))
+
+        # Rebuild detailed_pages by streaming the sidecar JSONL back
+        pages_path = FileUtils._pages_path(filepath)
+        if os.path.exists(pages_path):
+            detailed_pages = {}
+            for line in FileUtils._read_bytes(pages_path).splitlines():
+                record = orjson.loads(line)
+                detailed_pages[record['key']] = record['page']
+            report['detailed_pages'] = detailed_pages
+
+        return report
     
     @staticmethod
     def get_available_reports() -> List[str]:
         """Get list of available report files"""
-        return [f for f in os.listdir(Config.REPORTS_DIR) if f.endswith('.json')]
+        # scandir yields DirEntry objects with cached type info, avoiding a
+        # stat per entry on big report directories
+        with os.scandir(Config.REPORTS_DIR) as entries:
+            return [entry.name for entry in entries
+                    if entry.name.endswith(('.json', '.json.zst'))
+                    and entry.is_file(follow_symlinks=False)]
     
     @staticmethod
-    def cleanup_old_reports(max_age_days: int = 7):
+    def cleanup_old_reports(max_age_days: int = 7) -> int:
         """Clean up reports older than specified days"""
-        # Implementation for cleaning old files
-        pass
\ No newline at end of file
+        cutoff = time.time() - max_age_days * 86400
+        reports_log = os.path.basename(Config.REPORTS_LOG)
+        removed = 0
+
+        # DirEntry.stat() reuses the metadata scandir already fetched, so
+        # this is one pass with no extra stat syscall per file
+        with os.scandir(Config.REPORTS_DIR) as entries:
+            for entry in entries:
+                if entry.name == reports_log:
+                    continue
+                if not entry.name.endswith(('.json', '.jsonl', '.zst')):
+                    continue
+                try:
+                    if entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                        removed += 1
+                except OSError:
+                    continue
+
+        return removed
\ No newline at end of file
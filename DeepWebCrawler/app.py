@@ -1,27 +1,117 @@
 # deep_web_crawler.py
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from bs4 import BeautifulSoup
+import asyncio
+import functools
+import httpx
+import orjson
+import threading
 import time
-import json
 import os
-from urllib.parse import urljoin, urlparse
-from collections import deque
-import hashlib
+import re
+import tempfile
+from urllib.parse import urljoin, urlparse, urlsplit, urlunsplit, parse_qsl, urlencode
+from collections import defaultdict, Counter
+from concurrent.futures import ThreadPoolExecutor
+import zlib
+
+# Keyword tokens are 4+ character words; compiled once at import
+_WORD_RE = re.compile(r'\b\w{4,}\b')
+
+# Non-web resources worth skipping, matched at the end of the path (a
+# query string or fragment may follow); one C-level scan per URL instead
+# of lowering the URL and substring-testing each extension in Python
+_SKIP_EXT_RE = re.compile(
+    r'\.(?:pdf|jpe?g|png|gif|zip|exe|svg|ico|css|js|mp4|webm|woff2?)(?:[?#]|$)',
+    re.IGNORECASE)
+
+# Tag-to-bucket dispatch for the single extraction walk
+_TAG_BUCKETS = {
+    'p': 'paragraphs',
+    'ul': 'lists', 'ol': 'lists',
+    'b': 'bold', 'strong': 'bold',
+    'i': 'italic', 'em': 'italic',
+    'code': 'code', 'pre': 'code',
+    'blockquote': 'quotes',
+    'a': 'links',
+    'img': 'images',
+    'table': 'tables',
+    'form': 'forms',
+    'meta': 'meta',
+    'h1': 'headings', 'h2': 'headings', 'h3': 'headings',
+    'h4': 'headings', 'h5': 'headings', 'h6': 'headings',
+}
+
+# Boilerplate subtrees dropped during the same walk
+_STRIP_TAGS = frozenset({'script', 'style', 'nav', 'footer', 'header'})
+
+# Query params that change the URL but never the content
+_TRACKING_PARAMS = frozenset({'gclid', 'fbclid', 'sessionid', 'phpsessid'})
+_DEFAULT_PORTS = {'http': ':80', 'https': ':443'}
+
+# Bloom-filter dedup needs ~10 bits per URL instead of a full interned
+# string; optional, the exact set below covers its absence
+try:
+    from pybloom_live import ScalableBloomFilter
+except ImportError:
+    ScalableBloomFilter = None
+
+
+class _VisitedSet:
+    """Tracks visited URLs, backed by a scalable Bloom filter when available
+
+    At crawl scale a plain set of URL strings costs hundreds of bytes per
+    entry and goes cache-cold; the Bloom filter keeps membership tests in
+    a few cache lines at a 1e-6 false-positive rate. Falls back to an
+    exact set when pybloom_live is not installed.
+    """
+
+    def __init__(self):
+        if ScalableBloomFilter is not None:
+            self._seen = ScalableBloomFilter(initial_capacity=10000, error_rate=1e-6)
+        else:
+            self._seen = set()
+
+    def __contains__(self, url):
+        return url in self._seen
+
+    def add(self, url):
+        self._seen.add(url)
+
+    def update(self, urls):
+        for url in urls:
+            self._seen.add(url)
+
 
 class DeepWebCrawler:
-    def __init__(self, max_depth=3, max_pages_per_level=10):
+    USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+    # How many Chrome processes the render fallback may run at once
+    RENDER_WORKERS = 4
+
+    def __init__(self, max_depth=3, max_pages_per_level=10, collect_detail=True):
         self.max_depth = max_depth
         self.max_pages_per_level = max_pages_per_level
-        self.visited_urls = set()
-        self.crawl_data = {}
-        self.driver = None
-        
+        # With detail off, text extraction keeps counts and a short
+        # preview instead of every string on the page
+        self.collect_detail = collect_detail
+        self.visited_urls = _VisitedSet()
+        self.seen_hashes = []
+        # Tiny per-page summary kept in memory; full page data streams to
+        # the NDJSON cache so crawl memory stays flat regardless of size
+        self.crawl_index = {}
+        self._pages_file = None
+        self._pages_path = None
+        self._driver_local = threading.local()
+        self._drivers = []
+        self._drivers_lock = threading.Lock()
+        self._render_pool = None
+
     def setup_driver(self):
-        """Setup Chrome driver"""
+        """Create a Chrome driver for the calling render worker"""
         try:
             chrome_options = Options()
             chrome_options.add_argument("--headless=new")
@@ -29,17 +119,45 @@ class DeepWebCrawler:
             chrome_options.add_argument("--disable-dev-shm-usage")
             chrome_options.add_argument("--disable-gpu")
             chrome_options.add_argument("--window-size=1920,1080")
-            chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-            
-            self.driver = webdriver.Chrome(options=chrome_options)
-            return True
+            chrome_options.add_argument(f"--user-agent={self.USER_AGENT}")
+            # Return from driver.get on DOMContentLoaded instead of the
+            # full load event; render_page waits for readiness explicitly
+            chrome_options.page_load_strategy = 'eager'
+            # The extractor only reads <img> attributes from the DOM, so
+            # downloading the pixels is pure wasted bandwidth and render
+            # time; notifications just stall headless sessions
+            chrome_options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.default_content_setting_values.notifications": 2
+            })
+
+            driver = webdriver.Chrome(options=chrome_options)
+            with self._drivers_lock:
+                self._drivers.append(driver)
+            return driver
         except Exception as e:
             print(f"❌ ChromeDriver error: {e}")
-            return False
+            return None
+
+    def _get_driver(self):
+        """Persistent per-thread driver; WebDriver is not thread-safe,
+        so each render worker owns its own Chrome process"""
+        driver = getattr(self._driver_local, 'driver', None)
+        if driver is None:
+            driver = self.setup_driver()
+            self._driver_local.driver = driver
+        return driver
     
-    def get_domain(self, url):
-        """Extract domain from URL"""
-        return urlparse(url).netloc
+    @staticmethod
+    @functools.lru_cache(maxsize=65536)
+    def get_domain(url):
+        """Extract domain from URL
+
+        Memoized: every link's domain is checked several times per crawl
+        (is_external, should_crawl, report aggregation), and urlsplit is
+        regex work plus a tuple allocation each call.
+        """
+        return urlsplit(url).netloc
     
     def is_same_domain(self, url1, url2):
         """Check if two URLs belong to the same domain"""
@@ -48,53 +166,96 @@ class DeepWebCrawler:
     def normalize_url(self, url, base_url):
         """Convert relative URL to absolute"""
         return urljoin(base_url, url)
-    
+
+    def canonicalize_url(self, url):
+        """Collapse cosmetic URL variants to one canonical form
+
+        Sort-order params, fragments, session IDs and tracking junk make
+        the same page look like dozens of distinct URLs; canonicalizing
+        before the visited lookup stops the crawler re-fetching them.
+        """
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        netloc = parts.netloc.lower()
+
+        default_port = _DEFAULT_PORTS.get(scheme)
+        if default_port and netloc.endswith(default_port):
+            netloc = netloc.rsplit(':', 1)[0]
+
+        query = urlencode(sorted(
+            (key, value) for key, value in parse_qsl(parts.query)
+            if key.lower() not in _TRACKING_PARAMS
+            and not key.lower().startswith('utm_')))
+
+        return urlunsplit((scheme, netloc, parts.path, query, ''))
+
     def should_crawl(self, url, base_domain):
         """Check if URL should be crawled"""
-        if url in self.visited_urls:
+        if self.canonicalize_url(url) in self.visited_urls:
             return False
         
         if not url.startswith(('http://', 'https://')):
             return False
             
         # Skip non-web resources
-        if any(ext in url.lower() for ext in ['.pdf', '.jpg', '.png', '.gif', '.zip', '.exe']):
+        if _SKIP_EXT_RE.search(url):
             return False
             
         # Only crawl same domain (optional: remove this to crawl external links)
         return self.get_domain(url) == base_domain
     
     def extract_comprehensive_data(self, url, soup):
-        """Extract comprehensive data from page"""
+        """Extract comprehensive data from page
+
+        One walk over the document buckets every interesting element by
+        tag and drops boilerplate subtrees as it passes them, instead of
+        re-walking the whole tree with find_all per category (~15 walks).
+        """
         try:
             # Basic info
             title = soup.find('title')
-            title_text = title.get_text().strip() if title else "No Title"
-            
-            # Remove scripts and styles
-            for element in soup(["script", "style", "nav", "footer", "header"]):
-                element.decompose()
-            
+            title_text = title.get_text(strip=True) if title else "No Title"
+
+            buckets = {name: [] for name in set(_TAG_BUCKETS.values())}
+
+            node = soup.contents[0] if soup.contents else None
+            while node is not None:
+                name = node.name
+                if name in _STRIP_TAGS:
+                    # Jump past the subtree, then drop it entirely
+                    nxt = node.next_sibling
+                    parent = node.parent
+                    while nxt is None and parent is not None:
+                        nxt = parent.next_sibling
+                        parent = parent.parent
+                    node.decompose()
+                    node = nxt
+                    continue
+                bucket = _TAG_BUCKETS.get(name)
+                if bucket is not None:
+                    buckets[bucket].append(node)
+                node = node.next_element
+
             # Text content analysis
-            text_content = self.extract_text_content(soup)
-            
+            text_content = self.extract_text_content(buckets)
+
             # Links
-            links = self.extract_links(soup, url)
-            
+            links = self.extract_links(buckets['links'], url)
+
             # Images
-            images = self.extract_images(soup, url)
-            
+            images = self.extract_images(buckets['images'], url)
+
             # Tables
-            tables = self.extract_tables(soup)
-            
+            tables = self.extract_tables(buckets['tables'])
+
             # Forms
-            forms = self.extract_forms(soup)
-            
+            forms = self.extract_forms(buckets['forms'])
+
             # Headings structure
-            headings = self.extract_headings(soup)
-            
+            headings = self.extract_headings(buckets['headings'])
+
             # Metadata
-            metadata = self.extract_metadata(soup)
+            metadata = self.extract_metadata(buckets['meta'])
             
             return {
                 'url': url,
@@ -117,8 +278,16 @@ class DeepWebCrawler:
             print(f"Error extracting data from {url}: {e}")
             return None
     
-    def extract_text_content(self, soup):
-        """Extract and categorize text content"""
+    def extract_text_content(self, buckets):
+        """Extract and categorize text content from the walk's buckets
+
+        When collect_detail is off, only counts, the word total and a
+        three-paragraph preview are kept - text-heavy pages otherwise
+        allocate thousands of strings the report never shows.
+        """
+        if not self.collect_detail:
+            return self.summarize_text_content(buckets)
+
         text_data = {
             'paragraphs': [],
             'lists': [],
@@ -128,76 +297,115 @@ class DeepWebCrawler:
             'quotes': [],
             'total_word_count': 0
         }
-        
+
+        # get_text(' ', strip=True) strips during the walk, so no second
+        # pass or throwaway unstripped string per element; the walrus
+        # keeps it to one get_text call per element
         # Paragraphs
-        paragraphs = soup.find_all('p')
-        for p in paragraphs:
-            text = p.get_text().strip()
+        for p in buckets['paragraphs']:
+            text = p.get_text(' ', strip=True)
             if text and len(text) > 10:
                 text_data['paragraphs'].append(text)
-        
+
         # Lists
-        lists = soup.find_all(['ul', 'ol'])
-        for lst in lists:
-            items = [li.get_text().strip() for li in lst.find_all('li')]
+        for lst in buckets['lists']:
+            items = [li.get_text(' ', strip=True) for li in lst.find_all('li')]
             if items:
                 text_data['lists'].append({
                     'type': lst.name,
                     'items': items
                 })
-        
+
         # Bold text
-        bold_elements = soup.find_all(['b', 'strong'])
-        text_data['bold_text'] = [elem.get_text().strip() for elem in bold_elements if elem.get_text().strip()]
-        
+        text_data['bold_text'] = [text for elem in buckets['bold'] if (text := elem.get_text(' ', strip=True))]
+
         # Italic text
-        italic_elements = soup.find_all(['i', 'em'])
-        text_data['italic_text'] = [elem.get_text().strip() for elem in italic_elements if elem.get_text().strip()]
-        
+        text_data['italic_text'] = [text for elem in buckets['italic'] if (text := elem.get_text(' ', strip=True))]
+
         # Code blocks
-        code_elements = soup.find_all(['code', 'pre'])
-        text_data['code_blocks'] = [elem.get_text().strip() for elem in code_elements if elem.get_text().strip()]
-        
+        text_data['code_blocks'] = [text for elem in buckets['code'] if (text := elem.get_text(' ', strip=True))]
+
         # Quotes
-        quotes = soup.find_all('blockquote')
-        text_data['quotes'] = [quote.get_text().strip() for quote in quotes if quote.get_text().strip()]
-        
+        text_data['quotes'] = [text for quote in buckets['quotes'] if (text := quote.get_text(' ', strip=True))]
+
         # Total word count
         all_text = ' '.join(text_data['paragraphs'])
         text_data['total_word_count'] = len(all_text.split())
-        
+
         return text_data
-    
-    def extract_links(self, soup, base_url):
+
+    def summarize_text_content(self, buckets):
+        """Counts-and-preview variant of extract_text_content
+
+        The word count accumulates incrementally and only the first three
+        paragraphs are retained; the formatted-text categories collapse to
+        a single marker entry so content-type detection still works.
+        """
+        word_count = 0
+        paragraph_count = 0
+        preview = []
+        for p in buckets['paragraphs']:
+            text = p.get_text(' ', strip=True)
+            if text and len(text) > 10:
+                paragraph_count += 1
+                # split() handles the newlines/tabs get_text leaves
+                # inside wrapped text, matching detail mode's count
+                word_count += len(text.split())
+                if len(preview) < 3:
+                    preview.append(text)
+
+        def marker(elements):
+            return ['present'] if any(
+                elem.get_text(strip=True) for elem in elements) else []
+
+        return {
+            'paragraphs': preview,
+            'paragraph_count': paragraph_count,
+            'lists': [],
+            'bold_text': marker(buckets['bold']),
+            'italic_text': marker(buckets['italic']),
+            'code_blocks': marker(buckets['code']),
+            'quotes': marker(buckets['quotes']),
+            'total_word_count': word_count
+        }
+
+    def extract_links(self, anchors, base_url):
         """Extract all links with context"""
         links = []
-        for a in soup.find_all('a', href=True):
+        # The base domain is constant across the call and a page can have
+        # thousands of anchors; hoist it and bind the lookup locally so
+        # the hot loop does one urlsplit-or-cache-hit per link, not two
+        # attribute-resolved calls
+        get_domain = self.get_domain
+        base_domain = get_domain(base_url)
+
+        for a in anchors:
             try:
-                text = a.get_text().strip()
-                href = a['href']
-                
+                text = a.get_text(' ', strip=True)
+                href = a.get('href')
+
                 if href and not href.startswith(('javascript:', 'mailto:', 'tel:')):
                     full_url = self.normalize_url(href, base_url)
-                    
+
                     if full_url.startswith('http'):
                         link_data = {
                             'text': text[:200],
                             'url': full_url,
                             'title': a.get('title', ''),
-                            'is_external': self.get_domain(full_url) != self.get_domain(base_url),
+                            'is_external': get_domain(full_url) != base_domain,
                             'element_id': a.get('id', ''),
                             'css_class': a.get('class', [])
                         }
                         links.append(link_data)
             except:
                 continue
-        
+
         return links
     
-    def extract_images(self, soup, base_url):
+    def extract_images(self, img_elements, base_url):
         """Extract all images with details"""
         images = []
-        for img in soup.find_all('img', src=True):
+        for img in img_elements:
             try:
                 src = img.get('src')
                 if src:
@@ -217,39 +425,48 @@ class DeepWebCrawler:
         
         return images
     
-    def extract_tables(self, soup):
+    def extract_tables(self, table_elements):
         """Extract table data"""
         tables = []
-        for table in soup.find_all('table'):
+        for table in table_elements:
             try:
-                table_data = {
-                    'headers': [],
-                    'rows': [],
-                    'caption': table.find('caption').get_text().strip() if table.find('caption') else ''
-                }
-                
-                # Extract headers
-                headers = table.find_all('th')
-                table_data['headers'] = [header.get_text().strip() for header in headers]
-                
-                # Extract rows
-                rows = table.find_all('tr')
-                for row in rows:
-                    cells = row.find_all(['td', 'th'])
-                    row_data = [cell.get_text().strip() for cell in cells]
-                    if row_data:
-                        table_data['rows'].append(row_data)
-                
-                tables.append(table_data)
+                caption = ''
+                headers = []
+                rows = []
+                current_row = None
+
+                # One pass over the subtree replaces the separate caption,
+                # th and tr walks plus a find_all per row
+                for el in table.descendants:
+                    name = getattr(el, 'name', None)
+                    if name is None:
+                        continue
+                    if name == 'caption':
+                        caption = el.get_text(' ', strip=True)
+                    elif name == 'tr':
+                        current_row = []
+                        rows.append(current_row)
+                    elif name in ('td', 'th'):
+                        text = el.get_text(' ', strip=True)
+                        if name == 'th':
+                            headers.append(text)
+                        if current_row is not None:
+                            current_row.append(text)
+
+                tables.append({
+                    'headers': headers,
+                    'rows': [row for row in rows if row],
+                    'caption': caption
+                })
             except:
                 continue
-        
+
         return tables
     
-    def extract_forms(self, soup):
+    def extract_forms(self, form_elements):
         """Extract form data"""
         forms = []
-        for form in soup.find_all('form'):
+        for form in form_elements:
             try:
                 form_data = {
                     'action': form.get('action', ''),
@@ -275,18 +492,18 @@ class DeepWebCrawler:
         
         return forms
     
-    def extract_headings(self, soup):
+    def extract_headings(self, heading_elements):
         """Extract heading structure"""
-        headings = {}
-        for i in range(1, 7):
-            h_tags = soup.find_all(f'h{i}')
-            headings[f'h{i}'] = [h.get_text().strip() for h in h_tags if h.get_text().strip()]
+        headings = {f'h{i}': [] for i in range(1, 7)}
+        for h in heading_elements:
+            text = h.get_text(' ', strip=True)
+            if text:
+                headings[h.name].append(text)
         return headings
-    
-    def extract_metadata(self, soup):
+
+    def extract_metadata(self, meta_tags):
         """Extract meta tags"""
         metadata = {}
-        meta_tags = soup.find_all('meta')
         for meta in meta_tags:
             name = meta.get('name') or meta.get('property')
             content = meta.get('content', '')
@@ -294,215 +511,419 @@ class DeepWebCrawler:
                 metadata[name] = content
         return metadata
     
-    def crawl_page(self, url, depth):
-        """Crawl a single page"""
-        if depth > self.max_depth or url in self.visited_urls:
+    async def fast_fetch(self, client, url):
+        """Fetch a page over plain HTTP - 50-100x cheaper than Chrome"""
+        try:
+            response = await client.get(url, follow_redirects=True)
+            if 'text/html' not in response.headers.get('content-type', 'text/html'):
+                return url, None
+            return url, response.text
+        except Exception as e:
+            print(f"❌ Failed to fetch {url}: {e}")
+            return url, None
+
+    async def _fetch_wave(self, urls):
+        """Fetch one BFS depth level concurrently"""
+        async with httpx.AsyncClient(http2=True, timeout=10,
+                                     headers={'User-Agent': self.USER_AGENT}) as client:
+            return await asyncio.gather(*[self.fast_fetch(client, url) for url in urls])
+
+    def needs_browser(self, page_source):
+        """Heuristic: does this HTML need a browser to render?
+
+        Server-rendered pages come back with a title and mostly markup;
+        JS app shells are missing the title or are dominated by script
+        tags, so those fall back to Selenium.
+        """
+        lowered = page_source.lower()
+        if '<title' not in lowered:
+            return True
+        return lowered.count('<script') * 2000 > len(page_source)
+
+    def render_page(self, url):
+        """Selenium fallback for pages that need JavaScript rendering"""
+        driver = self._get_driver()
+        if driver is None:
             return None
-        
+
+        try:
+            driver.get(url)
+            # Wait for the document to actually finish loading; these are
+            # the JS-heavy pages, so body presence alone is too early
+            try:
+                WebDriverWait(driver, 10).until(
+                    lambda d: d.execute_script('return document.readyState') == 'complete'
+                )
+            except TimeoutException:
+                # Pages stuck short of complete (a hanging ad or
+                # tracker) still have usable markup; return what loaded
+                # instead of losing the page entirely
+                print(f"⏳ Render timeout on {url}, using partial page source")
+            return driver.page_source
+        except Exception as e:
+            print(f"❌ Failed to render {url}: {e}")
+            return None
+
+    def _render_wave(self, urls):
+        """Render JS-heavy pages in parallel across the browser pool
+
+        Chrome already runs as its own process, so worker threads in the
+        parent are enough to drive RENDER_WORKERS browsers concurrently;
+        the pool and its drivers persist across BFS waves.
+        """
+        if not urls:
+            return {}
+        if self._render_pool is None:
+            self._render_pool = ThreadPoolExecutor(max_workers=self.RENDER_WORKERS)
+        return dict(zip(urls, self._render_pool.map(self.render_page, urls)))
+
+    def _simhash(self, paragraphs):
+        """64-bit SimHash of the page's paragraph tokens
+
+        Near-identical pages (same content behind different paths or
+        pagination) land within a few bits of each other, so Hamming
+        distance gives a cheap content identity. Returns None when the
+        page has no paragraph text to fingerprint.
+        """
+        votes = [0] * 64
+        empty = True
+        for paragraph in paragraphs:
+            for token in paragraph.lower().split():
+                empty = False
+                h = hash(token)
+                for bit in range(64):
+                    if h >> bit & 1:
+                        votes[bit] += 1
+                    else:
+                        votes[bit] -= 1
+        if empty:
+            return None
+        return sum(1 << bit for bit in range(64) if votes[bit] > 0)
+
+    def is_near_duplicate(self, page_hash):
+        """True if a previously crawled page has nearly the same content"""
+        if page_hash is None:
+            return False
+        return any((page_hash ^ seen).bit_count() <= 3
+                   for seen in self.seen_hashes)
+
+    @staticmethod
+    def _page_key(url):
+        """Short unique key for a crawled page (non-cryptographic)"""
+        # crc32 is ~20x faster than the md5 digest this used to be; the
+        # key only needs to be unique enough to index the crawl
+        return format(zlib.crc32(url.encode()), '08x')
+
+    def _write_page(self, page_key, page_data):
+        """Append one crawled page to the on-disk NDJSON cache"""
+        if self._pages_file is None:
+            fd, self._pages_path = tempfile.mkstemp(suffix='.ndjson', prefix='crawl_')
+            self._pages_file = os.fdopen(fd, 'wb')
+        self._pages_file.write(orjson.dumps({'key': page_key, 'page': page_data},
+                                            option=orjson.OPT_APPEND_NEWLINE))
+
+    def iter_pages(self):
+        """Stream crawled pages back from the NDJSON cache"""
+        if self._pages_path is None:
+            return
+        with open(self._pages_path, 'rb') as f:
+            for line in f:
+                record = orjson.loads(line)
+                yield record['key'], record['page']
+
+    def discard_cache(self):
+        """Remove the on-disk page cache once the report is built"""
+        if self._pages_path:
+            try:
+                os.unlink(self._pages_path)
+            except OSError:
+                pass
+            self._pages_path = None
+
+    def crawl_page(self, url, depth, page_source):
+        """Extract data from an already-fetched page"""
         print(f"🔍 Crawling (Level {depth}): {url}")
-        self.visited_urls.add(url)
-        
+
         try:
-            if self.driver is None:
-                self.setup_driver()
-            else:    
-                self.driver.get(url)
-                # Wait for page to load
-                time.sleep(3)
-                
-                # Get page source and parse with BeautifulSoup
-                page_source = self.driver.page_source
-                soup = BeautifulSoup(page_source, 'html.parser')
-                
-                # Extract comprehensive data
-                page_data = self.extract_comprehensive_data(url, soup)
-                
-                if page_data:
-                    # Generate unique key for this page
-                    page_key = hashlib.md5(url.encode()).hexdigest()[:10]
-                    self.crawl_data[page_key] = page_data
-                    
-                    return page_data
-                else:
+            # Parse with BeautifulSoup; the lxml backend builds and walks
+            # the tree in C, roughly an order of magnitude faster than the
+            # pure-Python html.parser
+            soup = BeautifulSoup(page_source, 'lxml')
+
+            # Extract comprehensive data
+            page_data = self.extract_comprehensive_data(url, soup)
+
+            if page_data:
+                # BFS already knows how deep this page sits; record it so
+                # the report can bucket pages by level
+                page_data['depth'] = depth
+
+                # Skip near-duplicates (shared content under different
+                # URLs) so they neither get stored nor expand the frontier
+                page_hash = self._simhash(page_data['text_content']['paragraphs'])
+                if self.is_near_duplicate(page_hash):
+                    print(f"♻️ Skipping near-duplicate: {url}")
                     return None
-                
+                if page_hash is not None:
+                    self.seen_hashes.append(page_hash)
+
+                # Generate unique key for this page; the full record goes
+                # to disk, only the summary stays resident
+                page_key = self._page_key(url)
+                self._write_page(page_key, page_data)
+                self.crawl_index[page_key] = {
+                    'url': url,
+                    'title': page_data['title'],
+                    'links_found': page_data['links_found'],
+                    'images_found': page_data['images_found'],
+                    'word_count': page_data['text_content']['total_word_count']
+                }
+
+                return page_data
+            else:
+                return None
+
         except Exception as e:
             print(f"❌ Failed to crawl {url}: {e}")
             return None
-    
+
     def deep_crawl(self, start_url):
-        """Perform deep crawling starting from URL"""
-        if not self.setup_driver():
-            return {'error': 'Failed to initialize browser'}
-        
+        """Perform deep crawling starting from URL
+
+        Each depth level is fetched concurrently over plain HTTP; only
+        pages that look JS-rendered pay for a Chrome round trip, and the
+        driver is not even started unless one of them does.
+        """
         try:
             base_domain = self.get_domain(start_url)
-            queue = deque([(start_url, 0)])  # (url, depth)
             results = {
                 'start_url': start_url,
                 'base_domain': base_domain,
                 'max_depth': self.max_depth,
                 'total_pages_crawled': 0,
                 'crawl_start_time': time.time(),
-                'pages': {}
+                'page_index': self.crawl_index
             }
-            
-            while queue:
-                url, depth = queue.popleft()
-                
-                # Crawl the page
-                page_data = self.crawl_page(url, depth)
-                
-                if page_data:
-                    results['total_pages_crawled'] += 1
-                    page_key = hashlib.md5(url.encode()).hexdigest()[:10]
-                    results['pages'][page_key] = page_data
-                    
-                    # If not at max depth, add links to queue
-                    if depth < self.max_depth:
-                        internal_links = [link for link in page_data['links'] 
-                                        if not link['is_external'] and self.should_crawl(link['url'], base_domain)]
-                        
-                        # Limit links per page to avoid too many requests
-                        for link in internal_links[:self.max_pages_per_level]:
-                            if link['url'] not in self.visited_urls:
-                                queue.append((link['url'], depth + 1))
-                
-                # Stop if we've crawled enough pages
-                if results['total_pages_crawled'] >= 50:  # Safety limit
+
+            frontier = [start_url]
+            depth = 0
+
+            while frontier and depth <= self.max_depth:
+                self.visited_urls.update(map(self.canonicalize_url, frontier))
+                fetched = asyncio.run(self._fetch_wave(frontier))
+
+                # Keep HTTP results that look fully rendered; everything
+                # else goes through the browser pool in one parallel batch
+                pages = [(url, page_source if page_source is not None
+                          and not self.needs_browser(page_source) else None)
+                         for url, page_source in fetched]
+                rendered = self._render_wave([url for url, page_source in pages
+                                              if page_source is None])
+
+                next_frontier = []
+                queued = set()
+                for url, page_source in pages:
+                    if page_source is None:
+                        page_source = rendered.get(url)
+                    if page_source is None:
+                        continue
+
+                    # Crawl the page
+                    page_data = self.crawl_page(url, depth, page_source)
+
+                    if page_data:
+                        results['total_pages_crawled'] += 1
+
+                        # If not at max depth, add links to the next wave
+                        if depth < self.max_depth:
+                            internal_links = [link for link in page_data['links']
+                                            if not link['is_external'] and self.should_crawl(link['url'], base_domain)]
+
+                            # Limit links per page to avoid too many requests;
+                            # dedup the wave on canonical form so parameter
+                            # variants of one page are queued only once
+                            for link in internal_links[:self.max_pages_per_level]:
+                                canonical = self.canonicalize_url(link['url'])
+                                if canonical not in self.visited_urls and canonical not in queued:
+                                    queued.add(canonical)
+                                    next_frontier.append(link['url'])
+
+                    # Stop if we've crawled enough pages
+                    if results['total_pages_crawled'] >= 50:  # Safety limit
+                        break
+
+                if results['total_pages_crawled'] >= 50:
                     break
-            
+
+                frontier = next_frontier
+                depth += 1
+
             results['crawl_end_time'] = time.time()
             results['crawl_duration'] = results['crawl_end_time'] - results['crawl_start_time']
-            
+
             return results
-            
+
         finally:
-            if self.driver:
-                self.driver.quit()
+            if self._pages_file:
+                self._pages_file.close()
+                self._pages_file = None
+            if self._render_pool:
+                self._render_pool.shutdown()
+                self._render_pool = None
+            for driver in self._drivers:
+                try:
+                    driver.quit()
+                except Exception:
+                    pass
+            self._drivers.clear()
     
     def generate_report(self, crawl_results):
         """Generate comprehensive report"""
         if 'error' in crawl_results:
             return crawl_results
-        
-        # Calculate statistics
-        total_pages = crawl_results['total_pages_crawled']
-        total_links = sum(len(page['links']) for page in crawl_results['pages'].values())
-        total_images = sum(len(page['images']) for page in crawl_results['pages'].values())
-        total_tables = sum(len(page['tables']) for page in crawl_results['pages'].values())
-        total_words = sum(page['text_content']['total_word_count'] for page in crawl_results['pages'].values())
-        
+
+        # Pull the full pages back from the NDJSON cache in one pass;
+        # during the crawl itself only the light index was in memory
+        pages = dict(self.iter_pages())
+
+        # Every per-page statistic comes out of a single pass
+        aggregates = self._aggregate(pages)
+        stats = aggregates['stats']
+
         # Generate report
         report = {
             'crawl_summary': {
                 'start_url': crawl_results['start_url'],
                 'base_domain': crawl_results['base_domain'],
-                'total_pages_crawled': total_pages,
+                'total_pages_crawled': crawl_results['total_pages_crawled'],
                 'max_depth_reached': self.max_depth,
                 'crawl_duration_seconds': round(crawl_results['crawl_duration'], 2),
-                'total_links_found': total_links,
-                'total_images_found': total_images,
-                'total_tables_found': total_tables,
-                'total_words_extracted': total_words
+                'total_links_found': stats['links'],
+                'total_images_found': stats['images'],
+                'total_tables_found': stats['tables'],
+                'total_words_extracted': stats['words']
             },
-            'pages_by_depth': self.organize_pages_by_depth(crawl_results),
-            'site_structure': self.analyze_site_structure(crawl_results),
-            'content_analysis': self.analyze_content(crawl_results),
-            'detailed_pages': crawl_results['pages']
+            'pages_by_depth': self.organize_pages_by_depth(pages),
+            'site_structure': self.analyze_site_structure(pages, aggregates),
+            'content_analysis': self.analyze_content(pages, aggregates),
+            'detailed_pages': pages
         }
-        
+
         return report
-    
-    def organize_pages_by_depth(self, crawl_results):
+
+    def _aggregate(self, pages):
+        """Collect every per-page statistic in one pass
+
+        The report sections used to make eight separate full passes over
+        the pages (four totals twice, link counting, domain collection,
+        content-type checks); this loop feeds them all. Counter.update
+        runs the link increments in C.
+        """
+        stats = Counter()
+        link_counts = Counter()
+        external_domains = set()
+        content_types = set()
+
+        for page in pages.values():
+            text_content = page['text_content']
+            stats['links'] += len(page['links'])
+            stats['images'] += len(page['images'])
+            stats['tables'] += len(page['tables'])
+            stats['words'] += text_content['total_word_count']
+            # Summary-mode pages carry an explicit count; detailed pages
+            # still derive it from the list itself
+            stats['paragraphs'] += text_content.get(
+                'paragraph_count', len(text_content['paragraphs']))
+
+            link_counts.update(link['url'] for link in page['links']
+                               if not link['is_external'])
+            external_domains.update(self.get_domain(link['url'])
+                                    for link in page['links'] if link['is_external'])
+
+            if page['tables_found'] > 0:
+                content_types.add('tables')
+            if page['images_found'] > 0:
+                content_types.add('images')
+            if page['forms_found'] > 0:
+                content_types.add('forms')
+            if (text_content['code_blocks'] or text_content['bold_text']
+                    or text_content['italic_text']):
+                content_types.add('formatted_text')
+
+        return {
+            'stats': stats,
+            'link_counts': link_counts,
+            'external_domains': external_domains,
+            'content_types': content_types
+        }
+
+    def organize_pages_by_depth(self, pages):
         """Organize pages by their crawl depth"""
-        # This would require tracking depth for each page
-        # For simplicity, we'll just return the pages
-        return list(crawl_results['pages'].keys())
-    
-    def analyze_site_structure(self, crawl_results):
+        # String keys: orjson refuses int dict keys when the report is
+        # serialized for the API response
+        buckets = defaultdict(list)
+        for page_key, page in pages.items():
+            buckets[str(page.get('depth', 0))].append(page_key)
+        return dict(buckets)
+
+    def analyze_site_structure(self, pages, aggregates):
         """Analyze the overall site structure"""
-        pages = crawl_results['pages']
-        
         structure = {
-            'most_linked_pages': self.find_most_linked_pages(pages),
+            'most_linked_pages': self.find_most_linked_pages(aggregates['link_counts']),
             'page_titles': [page['title'] for page in pages.values()],
-            'unique_domains_linked': self.find_unique_domains(pages)
+            'unique_domains_linked': list(aggregates['external_domains'])
         }
-        
+
         return structure
-    
-    def analyze_content(self, crawl_results):
+
+    def analyze_content(self, pages, aggregates):
         """Analyze content across all pages"""
-        pages = crawl_results['pages']
-        
+        stats = aggregates['stats']
         content_analysis = {
             'total_content_volume': {
-                'words': sum(page['text_content']['total_word_count'] for page in pages.values()),
-                'paragraphs': sum(len(page['text_content']['paragraphs']) for page in pages.values()),
-                'images': sum(len(page['images']) for page in pages.values()),
-                'tables': sum(len(page['tables']) for page in pages.values())
+                'words': stats['words'],
+                'paragraphs': stats['paragraphs'],
+                'images': stats['images'],
+                'tables': stats['tables']
             },
-            'content_types_present': self.identify_content_types(pages),
+            'content_types_present': list(aggregates['content_types']),
             'common_keywords': self.extract_common_keywords(pages)
         }
-        
+
         return content_analysis
-    
-    def find_most_linked_pages(self, pages):
+
+    def find_most_linked_pages(self, link_counts):
         """Find pages with most internal links"""
-        link_counts = {}
-        for page in pages.values():
-            for link in page['links']:
-                if not link['is_external']:
-                    link_counts[link['url']] = link_counts.get(link['url'], 0) + 1
-        
-        return sorted(link_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-    
-    def find_unique_domains(self, pages):
-        """Find unique external domains linked"""
-        domains = set()
-        for page in pages.values():
-            for link in page['links']:
-                if link['is_external']:
-                    domains.add(self.get_domain(link['url']))
-        return list(domains)
-    
-    def identify_content_types(self, pages):
-        """Identify types of content present"""
-        content_types = set()
-        for page in pages.values():
-            if page['tables_found'] > 0:
-                content_types.add('tables')
-            if page['images_found'] > 0:
-                content_types.add('images')
-            if page['forms_found'] > 0:
-                content_types.add('forms')
-            if any(page['text_content'][key] for key in ['code_blocks', 'bold_text', 'italic_text']):
-                content_types.add('formatted_text')
-        
-        return list(content_types)
-    
+        # most_common heap-selects the top 10 instead of sorting every
+        # distinct URL
+        return link_counts.most_common(10)
+
     def extract_common_keywords(self, pages, top_n=20):
         """Extract common keywords from all content"""
-        from collections import Counter
-        import re
-        
-        all_text = ''
+        # Count per paragraph instead of concatenating everything into
+        # one giant string first - the old += loop was quadratic in total
+        # text, and memory now stays O(distinct words)
+        word_freq = Counter()
         for page in pages.values():
-            all_text += ' '.join(page['text_content']['paragraphs']) + ' '
-        
-        # Simple word frequency analysis
-        words = re.findall(r'\b\w{4,}\b', all_text.lower())
-        word_freq = Counter(words)
-        
+            for paragraph in page['text_content']['paragraphs']:
+                word_freq.update(_WORD_RE.findall(paragraph.lower()))
+
         return word_freq.most_common(top_n)
 
 # Flask Web Interface
-from flask import Flask, request, jsonify, render_template_string
+from flask import Flask, request
 
 app = Flask(__name__)
 
+def _orjson_response(obj):
+    """JSON response encoded by orjson's C path instead of stdlib json
+
+    Crawl reports embed every page's text and links; jsonify's
+    pure-Python encoder is a measurable slice of large /deep-crawl
+    responses.
+    """
+    return app.response_class(orjson.dumps(obj), mimetype='application/json')
+
 HTML_TEMPLATE = '''
 <!DOCTYPE html>
 <html>
@@ -681,29 +1102,33 @@ HTML_TEMPLATE = '''
 
 @app.route('/')
 def home():
-    return render_template_string(HTML_TEMPLATE)
+    # The page has no template variables, so re-parsing it through Jinja
+    # on every hit bought nothing; serve the string directly
+    return app.response_class(HTML_TEMPLATE, mimetype='text/html')
 
 @app.route('/deep-crawl', methods=['POST'])
 def deep_crawl():
     data = request.get_json()
     url = data.get('url', '').strip()
     max_depth = data.get('max_depth', 3)
-    
+    collect_detail = bool(data.get('detail', True))
+
     if not url:
-        return jsonify({'error': 'No URL provided'})
-    
+        return _orjson_response({'error': 'No URL provided'})
+
     print(f"🚀 Starting deep crawl: {url} (max depth: {max_depth})")
-    
-    crawler = DeepWebCrawler(max_depth=max_depth)
+
+    crawler = DeepWebCrawler(max_depth=max_depth, collect_detail=collect_detail)
     crawl_results = crawler.deep_crawl(url)
     
     if 'error' in crawl_results:
-        return jsonify({'success': False, 'error': crawl_results['error']})
+        return _orjson_response({'success': False, 'error': crawl_results['error']})
     
-    # Generate comprehensive report
+    # Generate comprehensive report, then drop the on-disk page cache
     report = crawler.generate_report(crawl_results)
-    
-    return jsonify({
+    crawler.discard_cache()
+
+    return _orjson_response({
         'success': True,
         'report': report
     })
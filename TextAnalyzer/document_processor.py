@@ -1,10 +1,116 @@
 import PyPDF2
 from docx import Document
+
+# pypdfium2 wraps Chromium's PDFium, which extracts text in native code
+# 5-20x faster than pure-Python PyPDF2; PyPDF2 stays as the fallback
+# backend when the binding is not installed
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+# charset-normalizer detects the encoding from a sampled prefix, so text
+# files decode correctly on the first try instead of via an exception-
+# driven utf-8 -> latin-1 cascade that rereads the file
+try:
+    from charset_normalizer import from_bytes as _detect_encoding
+except ImportError:
+    _detect_encoding = None
+import io
+import mmap
 import os
 import re
+import shutil
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from typing import Tuple, Dict, Any
 from fastapi import HTTPException
 
+# Poppler's pdftotext / pdfinfo CLIs, when installed, bypass Python for
+# the extraction hot loop entirely; located once at import
+_PDFTOTEXT = shutil.which('pdftotext')
+_PDFINFO = shutil.which('pdfinfo')
+_PDFINFO_PAGES_RE = re.compile(rb'^Pages:\s+(\d+)', re.MULTILINE)
+
+# Worker pools only pay off once there are enough pages to amortize the
+# process spawn; short PDFs extract serially
+_PARALLEL_PAGE_THRESHOLD = 4
+
+# TXT files at or above this size are memory-mapped rather than read,
+# so the bytes stay in the OS page cache until decode touches them
+_MMAP_THRESHOLD = 1 << 20
+
+_TOKEN_RE = re.compile(r'\S+')
+
+# Shared pool for page-parallel PDF extraction. The FastAPI app installs
+# one at startup via set_page_pool so requests never pay process spawn
+# cost; without it extract_text_from_pdf spins up a short-lived pool.
+_page_pool = None
+
+
+def set_page_pool(pool) -> None:
+    """Install a persistent ProcessPoolExecutor for PDF page extraction"""
+    global _page_pool
+    _page_pool = pool
+
+# Extensions the dispatcher accepts; frozenset membership is one hash
+# probe on the per-request validation path
+_SUPPORTED = frozenset({'pdf', 'docx', 'txt', 'doc'})
+
+
+def _decode_text(raw) -> str:
+    """Decode raw text bytes (bytes or memoryview) exactly once
+
+    With charset-normalizer installed the encoding is detected on a 64 KB
+    prefix and the decode never raises; otherwise fall back to trying
+    utf-8 then latin-1 against the same buffer.
+    """
+    if _detect_encoding is not None:
+        best = _detect_encoding(bytes(raw[:65536])).best()
+        encoding = best.encoding if best is not None else 'utf-8'
+        return str(raw, encoding, 'replace')
+    try:
+        return str(raw, 'utf-8')
+    except UnicodeDecodeError:
+        return str(raw, 'latin-1')
+
+
+def _count_words(text: str) -> int:
+    """Count whitespace-separated tokens in one pass
+
+    Unlike len(text.split()) this never materializes a list of every
+    substring, which matters on multi-megabyte documents.
+    """
+    return sum(1 for _ in _TOKEN_RE.finditer(text))
+
+
+def _pdfium_extract(source) -> Tuple[str, int]:
+    """Extract text with the PDFium backend from a path or bytes"""
+    pdf = pdfium.PdfDocument(source)
+    try:
+        num_pages = len(pdf)
+        parts = []
+        for page in pdf:
+            text_page = page.get_textpage()
+            parts.append(text_page.get_text_range())
+            text_page.close()
+            page.close()
+        return "\n\n".join(parts), num_pages
+    finally:
+        pdf.close()
+
+
+def _extract_one_page(file_path: str, page_num: int) -> str:
+    """Extract a single PDF page's text in a worker process
+
+    Module-level so ProcessPoolExecutor can pickle it by reference;
+    PyPDF2 readers are not picklable, so each worker reopens the file.
+    """
+    with open(file_path, 'rb') as file:
+        return PyPDF2.PdfReader(file).pages[page_num].extract_text()
+
+
 class DocumentProcessor:
     """
     Handles different document types: PDF, DOCX, TXT
@@ -16,15 +122,44 @@ class DocumentProcessor:
         Extract text from PDF file and return text + page count
         """
         try:
+            if _PDFTOTEXT:
+                try:
+                    result = subprocess.run([_PDFTOTEXT, '-q', file_path, '-'],
+                                            capture_output=True, timeout=60,
+                                            check=True)
+                    text = result.stdout.decode('utf-8', errors='replace')
+                    return text, DocumentProcessor._pdf_page_count(file_path)
+                except (subprocess.SubprocessError, OSError):
+                    # Poppler choked on this file; the Python backends
+                    # below get their turn
+                    pass
+
+            if pdfium is not None:
+                return _pdfium_extract(file_path)
+
             with open(file_path, 'rb') as file:
                 pdf_reader = PyPDF2.PdfReader(file)
-                
-                text = ""
-                for page_num in range(len(pdf_reader.pages)):
-                    page = pdf_reader.pages[page_num]
-                    text += page.extract_text() + "\n\n"
-                
-                return text, len(pdf_reader.pages)
+                num_pages = len(pdf_reader.pages)
+
+                if num_pages < _PARALLEL_PAGE_THRESHOLD:
+                    # Collect pages and join once: += recopies the whole
+                    # accumulated string on every page, which is quadratic
+                    parts = [page.extract_text() for page in pdf_reader.pages]
+                    text = "\n\n".join(parts)
+                    return text, num_pages
+
+            # Pages are independent and extract_text is CPU-bound pure
+            # Python, so larger PDFs fan pages out across processes; map
+            # returns results in page order
+            extract = partial(_extract_one_page, file_path)
+            if _page_pool is not None:
+                parts = list(_page_pool.map(extract, range(num_pages)))
+            else:
+                workers = min(num_pages, os.cpu_count() or 1)
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    parts = list(executor.map(extract, range(num_pages)))
+
+            return "\n\n".join(parts), num_pages
                 
         except Exception as e:
             raise HTTPException(
@@ -33,31 +168,61 @@ class DocumentProcessor:
             )
     
     @staticmethod
-    def extract_text_from_docx(file_path: str) -> Tuple[str, int]:
+    def _pdf_page_count(file_path: str) -> int:
         """
-        Extract text from DOCX file
+        Page count for the pdftotext fast path, cheapest source first
+        """
+        if _PDFINFO:
+            try:
+                info = subprocess.run([_PDFINFO, file_path],
+                                      capture_output=True, timeout=10,
+                                      check=True)
+                match = _PDFINFO_PAGES_RE.search(info.stdout)
+                if match:
+                    return int(match.group(1))
+            except (subprocess.SubprocessError, OSError):
+                pass
+
+        if pdfium is not None:
+            pdf = pdfium.PdfDocument(file_path)
+            try:
+                return len(pdf)
+            finally:
+                pdf.close()
+
+        with open(file_path, 'rb') as file:
+            return len(PyPDF2.PdfReader(file).pages)
+
+    @staticmethod
+    def extract_text_from_docx(file_path: str) -> Tuple[str, int, int]:
+        """
+        Extract text from DOCX file, returning text, estimated pages and
+        the word count so callers never tokenize the text a second time
         """
         try:
             doc = Document(file_path)
-            text = ""
-            
-            for paragraph in doc.paragraphs:
-                if paragraph.text.strip():
-                    text += paragraph.text + "\n"
-            
-            # Extract text from tables
+
+            # paragraph.text and cell.text rebuild their string from the
+            # underlying runs on every access, so each is read exactly
+            # once via the walrus binding
+            parts = [text for paragraph in doc.paragraphs
+                     if (text := paragraph.text).strip()]
+
+            # Extract text from tables, one line per row
             for table in doc.tables:
                 for row in table.rows:
-                    for cell in row.cells:
-                        if cell.text.strip():
-                            text += cell.text + " "
-                    text += "\n"
-            
+                    parts.append(" ".join(
+                        text for cell in row.cells
+                        if (text := cell.text).strip()))
+
+            # Single join keeps accumulation linear in document size
+            text = "\n".join(parts)
+
             # Rough page estimation (500 words per page)
-            word_count = len(text.split())
+            word_count = _count_words(text)
             estimated_pages = max(1, word_count // 500)
-            
-            return text, estimated_pages
+
+            return text, estimated_pages, word_count
             
         except Exception as e:
             raise HTTPException(
@@ -66,37 +231,33 @@ class DocumentProcessor:
             )
     
     @staticmethod
-    def extract_text_from_txt(file_path: str) -> Tuple[str, int]:
+    def extract_text_from_txt(file_path: str) -> Tuple[str, int, int]:
         """
-        Extract text from TXT file
+        Extract text from TXT file, returning text, estimated pages and
+        the word count so callers never tokenize the text a second time
         """
         try:
-            # Try UTF-8 first
-            with open(file_path, 'r', encoding='utf-8') as file:
-                text = file.read()
-            
+            if os.path.getsize(file_path) >= _MMAP_THRESHOLD:
+                # Map large files and decode straight from the page
+                # cache; any encoding fallback reuses the same mapping,
+                # so a bad encoding never costs a second read of the file
+                with open(file_path, 'rb') as file, \
+                        mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    view = memoryview(mm)
+                    try:
+                        text = _decode_text(view)
+                    finally:
+                        view.release()
+            else:
+                with open(file_path, 'rb') as file:
+                    text = _decode_text(file.read())
+
             # Rough page estimation
-            word_count = len(text.split())
+            word_count = _count_words(text)
             estimated_pages = max(1, word_count // 500)
-            
-            return text, estimated_pages
-            
-        except UnicodeDecodeError:
-            # Try other encodings
-            try:
-                with open(file_path, 'r', encoding='latin-1') as file:
-                    text = file.read()
-                
-                word_count = len(text.split())
-                estimated_pages = max(1, word_count // 500)
-                
-                return text, estimated_pages
-                
-            except Exception as e:
-                raise HTTPException(
-                    status_code=500, 
-                    detail=f"TXT extraction failed: {str(e)}"
-                )
+
+            return text, estimated_pages, word_count
+
         except Exception as e:
             raise HTTPException(
                 status_code=500, 
@@ -110,42 +271,144 @@ class DocumentProcessor:
         """
         if not filename:
             return "unknown"
-        
-        ext = filename.lower().split('.')[-1]
-        return ext
+
+        # splitext hands back just the extension, unlike split('.') which
+        # allocates a list of every dotted component
+        return os.path.splitext(filename)[1][1:].lower()
     
     @staticmethod
     def is_supported_file_type(filename: str) -> bool:
         """
         Check if file type is supported
         """
-        supported_types = ['pdf', 'docx', 'txt', 'doc']
-        file_type = DocumentProcessor.get_file_type(filename)
-        return file_type in supported_types
+        return DocumentProcessor.get_file_type(filename) in _SUPPORTED
     
     @staticmethod
-    def extract_text(file_path: str, filename: str) -> Dict[str, Any]:
+    def _iter_pdf_pages(file_path: str):
+        """Yield page text one page at a time for counts-only callers"""
+        if pdfium is not None:
+            pdf = pdfium.PdfDocument(file_path)
+            try:
+                for page in pdf:
+                    text_page = page.get_textpage()
+                    try:
+                        yield text_page.get_text_range()
+                    finally:
+                        text_page.close()
+                        page.close()
+            finally:
+                pdf.close()
+            return
+
+        with open(file_path, 'rb') as file:
+            for page in PyPDF2.PdfReader(file).pages:
+                yield page.extract_text()
+
+    @staticmethod
+    def extract_text(file_path: str, filename: str,
+                     counts_only: bool = False) -> Dict[str, Any]:
         """
         Main method to extract text from any supported document type
+
+        counts_only callers get word/character/page counts with an empty
+        "text"; PDFs then stream page by page so the full document string
+        is never assembled.
         """
         file_type = DocumentProcessor.get_file_type(filename)
-        
+
+        if counts_only and file_type == 'pdf':
+            word_count = 0
+            character_count = 0
+            pages = 0
+            try:
+                for piece in DocumentProcessor._iter_pdf_pages(file_path):
+                    word_count += _count_words(piece)
+                    character_count += len(piece)
+                    pages += 1
+            except Exception as e:
+                raise HTTPException(
+                    status_code=500,
+                    detail=f"PDF extraction failed: {str(e)}"
+                )
+            # Match the "\n\n" separators the joined-text path includes
+            character_count += max(0, pages - 1) * 2
+            return {
+                "text": "",
+                "page_count": pages,
+                "file_type": file_type,
+                "word_count": word_count,
+                "character_count": character_count
+            }
+
+        # The DOCX/TXT extractors already tokenized the text for their
+        # page estimate and hand the count back; only the PDF path (whose
+        # backends never split) counts here
         if file_type == 'pdf':
             text, pages = DocumentProcessor.extract_text_from_pdf(file_path)
+            word_count = _count_words(text)
         elif file_type in ['docx', 'doc']:
-            text, pages = DocumentProcessor.extract_text_from_docx(file_path)
+            text, pages, word_count = DocumentProcessor.extract_text_from_docx(file_path)
         elif file_type == 'txt':
-            text, pages = DocumentProcessor.extract_text_from_txt(file_path)
+            text, pages, word_count = DocumentProcessor.extract_text_from_txt(file_path)
         else:
             raise HTTPException(
                 status_code=400, 
                 detail=f"Unsupported file type: {file_type}. Supported: PDF, DOCX, TXT"
             )
         
+        return {
+            # Counts-only callers drop the document string here so the
+            # response never retains the multi-MB text
+            "text": "" if counts_only else text,
+            "page_count": pages,
+            "file_type": file_type,
+            "word_count": word_count,
+            "character_count": len(text)
+        }
+
+    @staticmethod
+    def extract_text_from_bytes(data: bytes, filename: str) -> Dict[str, Any]:
+        """
+        In-memory variant of extract_text for uploads small enough to
+        skip the temp file; every backend parses the buffer directly
+        """
+        file_type = DocumentProcessor.get_file_type(filename)
+
+        try:
+            if file_type == 'pdf':
+                if pdfium is not None:
+                    text, pages = _pdfium_extract(data)
+                else:
+                    pdf_reader = PyPDF2.PdfReader(io.BytesIO(data))
+                    text = "\n\n".join(page.extract_text()
+                                       for page in pdf_reader.pages)
+                    pages = len(pdf_reader.pages)
+                word_count = _count_words(text)
+            elif file_type in ['docx', 'doc']:
+                # python-docx accepts a file-like source as well as a path
+                text, pages, word_count = \
+                    DocumentProcessor.extract_text_from_docx(io.BytesIO(data))
+            elif file_type == 'txt':
+                text = _decode_text(data)
+                word_count = _count_words(text)
+                pages = max(1, word_count // 500)
+            else:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Unsupported file type: {file_type}. Supported: PDF, DOCX, TXT"
+                )
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"{file_type.upper()} extraction failed: {str(e)}"
+            )
+
         return {
             "text": text,
             "page_count": pages,
             "file_type": file_type,
-            "word_count": len(text.split()),
+            "word_count": word_count,
             "character_count": len(text)
         }
\ No newline at end of file
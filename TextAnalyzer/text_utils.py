@@ -1,60 +1,199 @@
+import heapq
 import re
 from collections import Counter
 from typing import Dict, List, Any
 
+# NumPy and numba are optional accelerators for the frequency/top-k hot
+# loops on big documents; everything falls back to the Counter/sort path
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _histogram(ids, n_unique):
+        counts = np.zeros(n_unique, dtype=np.int64)
+        for i in ids:
+            counts[i] += 1
+        return counts
+
+# Below this many tokens the JIT dispatch and interning overhead beats
+# what the kernels save
+_JIT_THRESHOLD = 4096
+
+# Compiled once at import: re's internal cache still pays a dict lookup
+# per call, and the sentence-split lookbehinds are expensive to re-parse
+_LETTERS_RE = re.compile(r'[a-zA-Z]')
+_DIGITS_RE = re.compile(r'\d')
+_PUNCT_RE = re.compile(r'[^\w\s]')
+_TOKEN_RE = re.compile(r'\b[a-zA-Z]+\b')
+_TOKEN_MIN2_RE = re.compile(r'\b[a-zA-Z]{2,}\b')
+_SENT_SPLIT_RE = re.compile(r'(?<!\w\.\w.)(?<![A-Z][a-z]\.)(?<=\.|\?|\!)\s')
+
+
+# Sentence-boundary candidates for the ASCII fast path: a terminator
+# followed by one whitespace byte (the \s set re uses for ASCII)
+_BOUNDARY_RE = re.compile(rb'[.!?][ \t\n\r\v\f\x1c-\x1f]')
+
+# ASCII bytes \w matches
+_ASCII_WORD = frozenset(b'_0123456789'
+                        b'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+                        b'abcdefghijklmnopqrstuvwxyz')
+
+
+def _split_sentences(text: str) -> List[str]:
+    """Split text into sentence segments, mirroring _SENT_SPLIT_RE
+
+    ASCII text takes the fast path: one C-level scan finds terminator+
+    whitespace candidates and the abbreviation lookbehinds become a few
+    direct byte comparisons per candidate, instead of the regex engine
+    evaluating two variable-width lookbehinds at every position. Other
+    text falls back to the compiled pattern.
+    """
+    if not text.isascii():
+        return _SENT_SPLIT_RE.split(text)
+
+    data = text.encode('ascii')
+    is_word = _ASCII_WORD.__contains__
+    parts = []
+    start = 0
+    for match in _BOUNDARY_RE.finditer(data):
+        i = match.start()
+        # (?<!\w\.\w.) -- e.g. "e.g." style abbreviations
+        if i >= 3 and data[i - 2] == 0x2e and is_word(data[i - 3]) \
+                and is_word(data[i - 1]):
+            continue
+        # (?<![A-Z][a-z]\.) -- e.g. "Dr." / "Mr."
+        if i >= 2 and data[i] == 0x2e and 65 <= data[i - 2] <= 90 \
+                and 97 <= data[i - 1] <= 122:
+            continue
+        parts.append(text[start:i + 1])
+        start = i + 2
+    parts.append(text[start:])
+    return parts
+
+
+def _build_class_table() -> bytes:
+    """Byte -> character-class table for the fused ASCII census
+
+    Classes mirror the regex definitions exactly: 0 space, 1 letter,
+    2 digit, 3 punctuation ([^\\w\\s], so underscore is excluded and
+    control bytes count), 4 other whitespace, 5 underscore.
+    """
+    table = bytearray([3] * 256)
+    for b in b'\t\n\r\v\f':
+        table[b] = 4
+    table[ord(' ')] = 0
+    for span in (b'AZ', b'az'):
+        for b in range(span[0], span[1] + 1):
+            table[b] = 1
+    for b in range(ord('0'), ord('9') + 1):
+        table[b] = 2
+    table[ord('_')] = 5
+    return bytes(table)
+
+
+_CLASS_TABLE = _build_class_table()
+
+# Simple stop words list; a module-level frozenset is built once and
+# gives the cheapest possible membership test in the filter loops
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
+    'this', 'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they'
+})
+
+
 class TextAnalyzer:
     @staticmethod
-    def count_words(text: str) -> int:
+    def count_words(text: str, words: List[str] = None) -> int:
         """Count total words in text"""
-        words = text.split()
+        if words is None:
+            words = text.split()
         return len(words)
     
     @staticmethod
     def count_characters(text: str) -> Dict[str, int]:
         """Count characters (with and without spaces)"""
+        if text.isascii():
+            # One translate pass maps every byte to its class and the
+            # Counter tallies all classes at once -- one sweep over the
+            # text instead of three regex scans plus a replace() copy
+            counts = Counter(text.encode('ascii').translate(_CLASS_TABLE))
+            return {
+                "with_spaces": len(text),
+                "without_spaces": len(text) - counts[0],
+                "letters_only": counts[1],
+                "digits": counts[2],
+                "punctuation": counts[3]
+            }
+
+        # Non-ASCII text keeps the unicode-aware regex definitions;
+        # count() avoids materializing a space-stripped copy
         return {
             "with_spaces": len(text),
-            "without_spaces": len(text.replace(" ", "")),
-            "letters_only": len(re.findall(r'[a-zA-Z]', text)),
-            "digits": len(re.findall(r'\d', text)),
-            "punctuation": len(re.findall(r'[^\w\s]', text))
+            "without_spaces": len(text) - text.count(" "),
+            "letters_only": len(_LETTERS_RE.findall(text)),
+            "digits": len(_DIGITS_RE.findall(text)),
+            "punctuation": len(_PUNCT_RE.findall(text))
         }
     
     @staticmethod
-    def count_sentences(text: str) -> int:
+    def count_sentences(text: str, sentences: List[str] = None) -> int:
         """Count sentences (improved approach)"""
-        # Count . ! ? as sentence endings, but avoid abbreviations
-        sentences = re.split(r'(?<!\w\.\w.)(?<![A-Z][a-z]\.)(?<=\.|\?|\!)\s', text)
-        # Filter out empty strings
-        sentences = [s.strip() for s in sentences if s.strip()]
+        if sentences is None:
+            # Count . ! ? as sentence endings, but avoid abbreviations;
+            # filter out empty strings
+            sentences = [s for s in _split_sentences(text) if s.strip()]
         return len(sentences)
     
     @staticmethod
-    def find_most_common_words(text: str, top_n: int = 10) -> List[Dict[str, Any]]:
-        """Find most common words (excluding stop words)"""
-        # Simple stop words list
-        stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 
-            'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
-            'this', 'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they'
-        }
-        
+    def find_most_common_words(text: str, top_n: int = 10,
+                               words: List[str] = None) -> List[Dict[str, Any]]:
+        """Find most common words (excluding stop words)
+
+        words, when given, is the precomputed list of lowercase alpha
+        tokens of two or more letters.
+        """
         # Convert to lowercase and split into words
-        words = re.findall(r'\b[a-zA-Z]{2,}\b', text.lower())
-        
-        # Filter out stop words
-        filtered_words = [word for word in words if word not in stop_words]
-        
-        if not filtered_words:
-            # If all words are stop words, use original words
-            filtered_words = words
-        
+        if words is None:
+            words = _TOKEN_MIN2_RE.findall(text.lower())
+
         # Count word frequencies
-        word_counts = Counter(filtered_words)
-        
+        if numba is not None and len(words) >= _JIT_THRESHOLD:
+            filtered_words = [word for word in words if word not in _STOP_WORDS]
+            if not filtered_words:
+                # If all words are stop words, use original words
+                filtered_words = words
+            # Intern words to dense ids, histogram them in a JIT kernel
+            # and take top-n with a stable argsort so ties keep
+            # first-seen order like Counter.most_common
+            intern = {}
+            ids = np.fromiter((intern.setdefault(w, len(intern))
+                               for w in filtered_words),
+                              dtype=np.int32, count=len(filtered_words))
+            counts = _histogram(ids, len(intern))
+            vocab = list(intern)
+            order = np.argsort(-counts, kind='stable')[:top_n]
+            top_words = [(vocab[i], int(counts[i])) for i in order]
+        else:
+            # Stop-word rejection streams straight into the C-level
+            # tally instead of materializing a filtered list first
+            counts = Counter(word for word in words if word not in _STOP_WORDS)
+            if not counts:
+                # If all words are stop words, use original words
+                counts = Counter(words)
+            top_words = counts.most_common(top_n)
+
         # Get top N words
         common_words = []
-        for word, count in word_counts.most_common(top_n):
+        for word, count in top_words:
             common_words.append({
                 "word": word,
                 "count": count,
@@ -64,11 +203,13 @@ class TextAnalyzer:
         return common_words
     
     @staticmethod
-    def calculate_readability(text: str) -> Dict[str, float]:
+    def calculate_readability(text: str, words: List[str] = None,
+                              sentences: List[str] = None) -> Dict[str, float]:
         """Enhanced readability scores"""
-        words = text.split()
-        sentences = re.split(r'(?<!\w\.\w.)(?<![A-Z][a-z]\.)(?<=\.|\?|\!)\s', text)
-        sentences = [s.strip() for s in sentences if s.strip()]
+        if words is None:
+            words = text.split()
+        if sentences is None:
+            sentences = [s for s in _split_sentences(text) if s.strip()]
         
         if len(sentences) == 0 or len(words) == 0:
             return {
@@ -79,8 +220,9 @@ class TextAnalyzer:
         
         avg_sentence_length = len(words) / len(sentences)
         
-        # Average word length (characters per word)
-        total_chars = sum(len(word) for word in words)
+        # Average word length (characters per word); map(len, ...) keeps
+        # the whole reduction in C instead of a generator frame per word
+        total_chars = sum(map(len, words))
         avg_word_length = total_chars / len(words)
         
         # Estimate reading time (200 words per minute)
@@ -94,34 +236,56 @@ class TextAnalyzer:
         }
     
     @staticmethod
-    def find_longest_words(text: str, top_n: int = 5) -> List[Dict[str, Any]]:
+    def find_longest_words(text: str, top_n: int = 5,
+                           words: List[str] = None) -> List[Dict[str, Any]]:
         """Find longest words in text"""
-        words = re.findall(r'\b[a-zA-Z]+\b', text)
-        
+        if words is None:
+            words = _TOKEN_RE.findall(text)
+
         if not words:
             return []
         
         # Get unique words and their lengths
-        unique_words = set(words)
-        word_lengths = [{"word": word, "length": len(word)} for word in unique_words]
-        
-        # Sort by length (descending) and get top N
-        word_lengths.sort(key=lambda x: x["length"], reverse=True)
-        
-        return word_lengths[:top_n]
+        unique_words = list(set(words))
+
+        if np is not None and len(unique_words) >= _JIT_THRESHOLD:
+            # Vectorized top-n over the length array instead of building
+            # and fully sorting a list of dicts
+            lengths = np.fromiter(map(len, unique_words), dtype=np.int64,
+                                  count=len(unique_words))
+            order = np.argsort(-lengths, kind='stable')[:top_n]
+            return [{"word": unique_words[i], "length": int(lengths[i])}
+                    for i in order]
+
+        # nlargest keeps a top_n-sized heap -- O(n log top_n) instead of
+        # sorting every unique word to keep five of them
+        longest = heapq.nlargest(top_n, unique_words, key=len)
+        return [{"word": word, "length": len(word)} for word in longest]
     
     @staticmethod
     def analyze_text(text: str) -> Dict[str, Any]:
         """Comprehensive text analysis"""
+        # Tokenize once and hand the results to every helper; the
+        # standalone methods used to re-scan the same text up to six
+        # times between them
+        words = text.split()
+        # One findall on the cased text feeds both token lists; lowering
+        # the short tokens beats copying and re-scanning the whole text
+        alpha_words = _TOKEN_RE.findall(text)
+        alpha_lower = [w.lower() for w in alpha_words]
+        min2_lower = [w for w in alpha_lower if len(w) >= 2]
+        sentences = [s.strip() for s in _split_sentences(text) if s.strip()]
+
         analysis = {
-            "word_count": TextAnalyzer.count_words(text),
+            "word_count": len(words),
             "character_counts": TextAnalyzer.count_characters(text),
-            "sentence_count": TextAnalyzer.count_sentences(text),
-            "common_words": TextAnalyzer.find_most_common_words(text),
-            "readability": TextAnalyzer.calculate_readability(text),
+            "sentence_count": len(sentences),
+            "common_words": TextAnalyzer.find_most_common_words(text, words=min2_lower),
+            "readability": TextAnalyzer.calculate_readability(text, words=words,
+                                                              sentences=sentences),
             "paragraph_count": text.count('\n\n') + 1,
-            "longest_words": TextAnalyzer.find_longest_words(text),
-            "unique_words": len(set(re.findall(r'\b[a-zA-Z]+\b', text.lower())))
+            "longest_words": TextAnalyzer.find_longest_words(text, words=alpha_words),
+            "unique_words": len(set(alpha_lower))
         }
-        
+
         return analysis
\ No newline at end of file
@@ -1,25 +1,35 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
 
-# SQLite database file
-SQLALCHEMY_DATABASE_URL = "sqlite:///./todos.db"
+# SQLite database file, served through the aiosqlite async driver
+SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///./todos.db"
 
 # Create engine - this manages database connections
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, 
-    connect_args={"check_same_thread": False}
-)
+engine = create_async_engine(SQLALCHEMY_DATABASE_URL)
 
-# Create session factory - for database operations
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Tune every new SQLite connection: WAL lets readers proceed while a
+# write is in flight (the default journal serializes them), NORMAL sync
+# drops an fsync per commit safely under WAL, and the cache/mmap sizes
+# keep hot pages out of syscalls
+@event.listens_for(engine.sync_engine, "connect")
+def _sqlite_pragmas(dbapi_conn, _connection_record):
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA cache_size=-65536")  # 64 MB
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+# Create session factory - for database operations; expire_on_commit
+# off so committed objects can be returned without a reload
+SessionLocal = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
 
 # Base class for our models
 Base = declarative_base()
 
 # Dependency to get database session
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
\ No newline at end of file
+async def get_db():
+    async with SessionLocal() as db:
+        yield db
\ No newline at end of file
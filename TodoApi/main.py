@@ -1,17 +1,21 @@
-from turtle import mode
 from fastapi import FastAPI, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
 import models
 import schemas
 from database import engine, get_db
 
-# Create all database tables
-models.Base.metadata.create_all(bind=engine)
-
 # Create FastAPI app
-app = FastAPI(title="Simple Todo API", version="1.0.0") 
+app = FastAPI(title="Simple Todo API", version="1.0.0")
+
+# Create all database tables; the async engine needs a running loop, so
+# this happens at startup rather than import
+@app.on_event("startup")
+async def create_tables():
+    async with engine.begin() as conn:
+        await conn.run_sync(models.Base.metadata.create_all)
 
 # Root endpoint
 @app.get("/")
@@ -23,55 +27,76 @@ def read_root():
 def health_check():
     return {"status": "healthy"}
 
-# Get all todos
+# Get all todos (paginated so big tables are not read whole)
 @app.get("/todos", response_model=List[schemas.TodoResponse])
-def get_todos(db: Session = Depends(get_db)):
-    todos = db.query(models.Todo).all()
-    return todos
+async def get_todos(skip: int = 0, limit: int = 100,
+                    db: AsyncSession = Depends(get_db)):
+    result = await db.execute(select(models.Todo).offset(skip).limit(limit))
+    return result.scalars().all()
 
 # Create a new todo
 @app.post("/todos", response_model=schemas.TodoResponse)
-def create_todo(todo: schemas.TodoCreate, db: Session = Depends(get_db)):
+async def create_todo(todo: schemas.TodoCreate, db: AsyncSession = Depends(get_db)):
     db_todo = models.Todo(
         title=todo.title,
         description=todo.description,
         completed=False
     )
     db.add(db_todo)
-    db.commit()
-    db.refresh(db_todo)
+    await db.commit()
+    await db.refresh(db_todo)
     return db_todo
 
+# Create many todos with one INSERT and one commit, instead of a
+# request (and transaction) per row
+@app.post("/todos/bulk")
+async def create_todos_bulk(todos: List[schemas.TodoCreate],
+                            db: AsyncSession = Depends(get_db)):
+    # An empty parameter list would not no-op: execute() falls back to a
+    # plain single-row insert of defaults
+    if not todos:
+        return {"created": 0}
+    await db.execute(
+        insert(models.Todo),
+        [{"title": todo.title, "description": todo.description, "completed": False}
+         for todo in todos]
+    )
+    await db.commit()
+    return {"created": len(todos)}
+
 # Get a specific todo
 @app.get("/todos/{todo_id}", response_model=schemas.TodoResponse)
-def get_todo(todo_id: int, db: Session = Depends(get_db)):
-    todo = db.query(models.Todo).filter(models.Todo.id == todo_id).first()
+async def get_todo(todo_id: int, db: AsyncSession = Depends(get_db)):
+    # get() takes the identity-map shortcut for primary-key lookups and
+    # skips compiling a filter query
+    todo = await db.get(models.Todo, todo_id)
     if todo is None:
         raise HTTPException(status_code=404, detail="Todo not found")
     return todo
 
 # Update a todo
 @app.put("/todos/{todo_id}", response_model=schemas.TodoResponse)
-def update_todo(todo_id: int, todo_update: schemas.TodoUpdate, db: Session = Depends(get_db)):
-    db_todo = db.query(models.Todo).filter(models.Todo.id == todo_id).first() 
+async def update_todo(todo_id: int, todo_update: schemas.TodoUpdate,
+                      db: AsyncSession = Depends(get_db)):
+    db_todo = await db.get(models.Todo, todo_id)
     if db_todo is None:
-        raise HTTPException(status_code=404, detail="Todo not found") 
+        raise HTTPException(status_code=404, detail="Todo not found")
     if todo_update.title is not None:
-        db_todo.title = models.Todo(title=todo_update.title).title
+        db_todo.title = todo_update.title
     if todo_update.description is not None:
-        db_todo.description = models.Todo(description=todo_update.description).description
+        db_todo.description = todo_update.description
     if todo_update.completed is not None:
-        db_todo.completed = models.Todo(completed=todo_update.completed).completed
-    db.commit()
-    db.refresh(db_todo)
+        db_todo.completed = todo_update.completed
+    await db.commit()
+    await db.refresh(db_todo)
     return db_todo
 
 # Delete a todo
 @app.delete("/todos/{todo_id}")
-def delete_todo(todo_id: int, db: Session = Depends(get_db)):
-    db_todo = db.query(models.Todo).filter(models.Todo.id == todo_id).first()
+async def delete_todo(todo_id: int, db: AsyncSession = Depends(get_db)):
+    db_todo = await db.get(models.Todo, todo_id)
     if db_todo is None:
-        raise HTTPException(status_code=404, detail="Todo not found") 
-    db.delete(db_todo)
-    db.commit()
-    return {"message": "Todo deleted successfully"}
\ No newline at end of file
+        raise HTTPException(status_code=404, detail="Todo not found")
+    await db.delete(db_todo)
+    await db.commit()
+    return {"message": "Todo deleted successfully"}